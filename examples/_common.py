@@ -0,0 +1,77 @@
+"""
+Shared helpers for the BagelPay SDK examples.
+
+This module imports whichever bagelpay package the calling example has
+already made importable; it never alters sys.path itself.
+"""
+
+import os
+import functools
+from typing import Any, Optional
+
+from bagelpay.client import BagelPayClient
+
+# BAGELPAY_TEST_MODE, parsed once for every example; test mode is the default
+# and only an explicit 0/false/no/off switches to live mode
+_TEST_MODE = os.environ.get('BAGELPAY_TEST_MODE', 'true').strip().lower() not in ('0', 'false', 'no', 'off')
+
+
+@functools.lru_cache(maxsize=4)
+def get_client(
+    api_key: Optional[str] = None,
+    base_url: Optional[str] = None,
+    test_mode: Optional[bool] = None,
+    **options: Any
+) -> BagelPayClient:
+    """
+    Initialize and return a BagelPay client.
+    
+    Clients are cached per argument combination, so every example imported
+    into the same process shares one client and its connection pool.
+    
+    Args:
+        api_key (Optional[str]): Your BagelPay API key. If not provided, will read from BAGELPAY_API_KEY environment variable.
+        base_url (Optional[str]): Custom base URL for the API. If not provided, will use the default URL based on test_mode.
+        test_mode (Optional[bool]): Whether to use test mode. If not provided, will read from BAGELPAY_TEST_MODE.
+        **options: Extra BagelPayClient arguments (e.g. http2=True, cache_ttl=30).
+            Without them the client uses the SDK defaults.
+    
+    Environment variables:
+    - BAGELPAY_API_KEY: Your BagelPay API key (required if api_key parameter is not provided)
+    - BAGELPAY_TEST_MODE: Whether to use test mode (optional, defaults to true)
+    
+    Returns:
+        BagelPayClient: Initialized BagelPay client instance
+    
+    Raises:
+        ValueError: If no API key is provided via parameter or environment variable
+    """
+    # Get API key from parameter or environment variable
+    if api_key is None:
+        api_key = os.getenv('BAGELPAY_API_KEY')
+    
+    if not api_key:
+        raise ValueError(
+            "API key is required. Either pass it as a parameter or "
+            "set BAGELPAY_API_KEY environment variable with: export BAGELPAY_API_KEY='your_api_key_here'"
+        )
+    
+    if test_mode is None:
+        test_mode = _TEST_MODE
+    
+    # Initialize the client
+    client_kwargs = {
+        'api_key': api_key,
+        'test_mode': test_mode,
+        'timeout': 30,  # 30 seconds timeout
+        **options
+    }
+    
+    # Add base_url if provided
+    if base_url is not None:
+        client_kwargs['base_url'] = base_url
+    
+    client = BagelPayClient(**client_kwargs)
+    
+    print(f"✅ BagelPay client initialized in {'Test' if test_mode else 'Live'} mode")
+    return client
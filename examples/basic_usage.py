@@ -7,35 +7,50 @@ This example demonstrates the basic usage of the BagelPay SDK including:
 - Product management (create, list, get, update)
 - Checkout session creation
 - Transaction listing
+- Concurrent listing with the async client
 - Error handling
 
 Before running this example:
 1. Install the SDK: pip install bagelpay
 2. Set your API key as an environment variable: export BAGELPAY_API_KEY="your_api_key_here"
 3. Optionally set test mode: export BAGELPAY_TEST_MODE="false" (defaults to true)
+
+Output goes through the "bagelpay.example" logger; run with --quiet to only
+show errors.
 """
 
 import os
 import sys
 import random
+import asyncio
+import functools
+import logging
+import operator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
-
-# Add the parent directory to the path to import the SDK
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from src.bagelpay.client import BagelPayClient
-from src.bagelpay.models import (
+from typing import TYPE_CHECKING, Optional, List
+
+# Use the SDK from this checkout when there is one: the examples rely on APIs
+# newer than the published release
+_SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+if os.path.isdir(os.path.join(_SRC_DIR, 'bagelpay')):
+    sys.path.insert(0, _SRC_DIR)
+
+if __package__:
+    from ._common import _TEST_MODE
+else:
+    from _common import _TEST_MODE
+
+from bagelpay.client import BagelPayClient
+from bagelpay.async_client import AsyncBagelPayClient
+from bagelpay.models import (
     Customer,
     CheckoutRequest,
     CreateProductRequest,
     UpdateProductRequest,
-    ApiError,
-    Subscription,
-    SubscriptionListResponse,
-    CustomerListResponse
+    Subscription
 )
-from src.bagelpay.exceptions import (
+from bagelpay.exceptions import (
     BagelPayError,
     BagelPayAPIError,
     BagelPayAuthenticationError,
@@ -43,6 +58,58 @@ from src.bagelpay.exceptions import (
     BagelPayNotFoundError
 )
 
+if TYPE_CHECKING:
+    # Only referenced in annotations
+    from bagelpay.models import CustomerData, ProductListResponse, TransactionListResponse
+
+log = logging.getLogger("bagelpay.example")
+
+# Environment configuration, read once at import
+_ENV_API_KEY = os.environ.get('BAGELPAY_API_KEY')
+
+# Sample data for the randomly generated products
+_BILLING = ("subscription", "subscription", "subscription", "single_payment")
+_UPDATE_BILLING = ("subscription", "subscription", "single_payment")
+_TAX = ("digital_products", "saas_services", "ebooks")
+_INTERVAL = ("daily", "weekly", "monthly", "3months", "6months")
+_TRIAL = (0, 1, 7)
+_UNITS = ("1", "2", "3", "4")
+_SUCCESS_URLS = (None, "https://yourapp.com/success")
+_RNG = random.Random()
+
+# Subscription states that can be inspected or canceled
+_ACTIVE_STATES = frozenset({"active", "trialing"})
+
+# Products fetched per page; larger pages mean fewer round-trips
+_PRODUCT_PAGE_SIZE = 50
+
+# Section separators
+_SEP30 = "=" * 30
+_SEP50 = "=" * 50
+
+# Field extractors for the listing loops; each returns a tuple in one call
+_PROD_FIELDS = operator.attrgetter(
+    "product_id", "name", "price", "currency", "recurring_interval", "is_archive"
+)
+_TXN_FIELDS = operator.attrgetter(
+    "transaction_id", "amount", "currency", "type", "customer", "created_at", "remark"
+)
+_SUB_FIELDS = operator.attrgetter(
+    "subscription_id", "status", "product_name", "customer.email", "next_billing_amount",
+    "recurring_interval", "payment_method", "created_at", "trial_start", "trial_end",
+    "billing_period_end"
+)
+_CUST_FIELDS = operator.attrgetter("name", "email", "subscriptions", "total_spend")
+
+# Row template for transaction listings, filled with str.format_map
+_TXN_TMPL = (
+    "   {i}. Transaction {tid}\n"
+    "      Amount: ${amt:.2f} {cur}\n"
+    "      Type: {typ}\n"
+    "      Customer: {email}\n"
+    "      Created: {created}"
+)
+
 
 def get_client(api_key: Optional[str] = None, base_url: Optional[str] = None) -> BagelPayClient:
     """
@@ -55,6 +122,7 @@ def get_client(api_key: Optional[str] = None, base_url: Optional[str] = None) ->
     Environment variables:
     - BAGELPAY_API_KEY: Your BagelPay API key (required if api_key parameter is not provided)
     - BAGELPAY_TEST_MODE: Whether to use test mode (optional, defaults to true)
+    Both are read once when the module is imported.
     
     Returns:
         BagelPayClient: Initialized BagelPay client instance
@@ -64,7 +132,7 @@ def get_client(api_key: Optional[str] = None, base_url: Optional[str] = None) ->
     """
     # Get API key from parameter or environment variable
     if api_key is None:
-        api_key = os.getenv('BAGELPAY_API_KEY')
+        api_key = _ENV_API_KEY
     
     if not api_key:
         raise ValueError(
@@ -73,13 +141,14 @@ def get_client(api_key: Optional[str] = None, base_url: Optional[str] = None) ->
         )
     
     # Use test mode by default for examples
-    test_mode = os.getenv('BAGELPAY_TEST_MODE', 'true').lower() != 'false'
+    test_mode = _TEST_MODE
     
     # Initialize the client
     client_kwargs = {
         'api_key': api_key,
         'test_mode': test_mode,
-        'timeout': 30  # 30 seconds timeout
+        'timeout': 30,  # 30 seconds timeout
+        'cache_ttl': 30  # Reuse read-only results (e.g. list_subscriptions) for 30 seconds
     }
     
     # Add base_url if provided
@@ -88,123 +157,152 @@ def get_client(api_key: Optional[str] = None, base_url: Optional[str] = None) ->
     
     client = BagelPayClient(**client_kwargs)
     
-    print(f"✅ BagelPay client initialized")
-    print(f"   Mode: {'Test' if test_mode else 'Live'}")
-    print(f"   Base URL: {client.base_url}")
-    print(f"   API Key: {api_key[:8]}...{api_key[-4:]}")
+    if log.isEnabledFor(logging.INFO):
+        log.info("✅ BagelPay client initialized")
+        log.info("   Mode: %s", 'Test' if test_mode else 'Live')
+        log.info("   Base URL: %s", client.base_url)
+        log.info("   API Key: %s...%s", api_key[:8], api_key[-4:])
     
     return client
 
 
-def create_sample_product(client: BagelPayClient) -> str:
+@functools.lru_cache(maxsize=1)
+def _default_client() -> BagelPayClient:
+    """
+    Return the process-wide client shared by the example helpers.
+    
+    Helpers called without a client reuse this instance, so its pooled
+    session (and cache) survives across calls instead of a new client and
+    connection pool being created each time.
+    """
+    return get_client()
+
+
+def create_sample_product(client: Optional[BagelPayClient] = None) -> str:
     """
     Create a sample product and return its product_id.
     """
-    print("\n📦 Creating a sample product...")
+    if client is None:
+        client = _default_client()
+    
+    log.info("\n📦 Creating a sample product...")
     
     try:
         # Create a product request
+        suffix = str(_RNG.randint(1000, 9999))
         product_request = CreateProductRequest(
-            name="Product_" + str(random.randint(1000, 9999)),
-            description="Description_of_product_" + str(random.randint(1000, 9999)),
-            price=random.uniform(50.5, 1024.5),
+            name="Product_" + suffix,
+            description="Description_of_product_" + suffix,
+            price=_RNG.uniform(50.5, 1024.5),
             currency="USD",
-            billing_type=random.choice(["subscription", "subscription", "subscription", "single_payment"]),
+            billing_type=_RNG.choice(_BILLING),
             tax_inclusive=False,
-            tax_category=random.choice(["digital_products", "saas_services", "ebooks"]),
-            recurring_interval=random.choice(["daily", "weekly", "monthly", "3months", "6months"]),
-            trial_days=random.choice([0, 1, 7])
+            tax_category=_RNG.choice(_TAX),
+            recurring_interval=_RNG.choice(_INTERVAL),
+            trial_days=_RNG.choice(_TRIAL)
         )
         
         # Create the product
         product = client.create_product(product_request)
         
-        print(f"✅ Product created successfully!")
-        print(f"   Product ID: {product.product_id}")
-        print(f"   Billing Type: {product.billing_type}")
-        print(f"   Name: {product.name}")
+        log.info("✅ Product created successfully!")
+        log.info("   Product ID: %s", product.product_id)
+        log.info("   Billing Type: %s", product.billing_type)
+        log.info("   Name: %s", product.name)
         if product.recurring_interval:
-            print(f"   Price: ${product.price}/{product.recurring_interval} {product.currency}")
+            log.info("   Price: $%s/%s %s", product.price, product.recurring_interval, product.currency)
         else:
-            print(f"   Price: ${product.price} {product.currency}")
-        print(f"   URL: {product.product_url}")
+            log.info("   Price: $%s %s", product.price, product.currency)
+        log.info("   URL: %s", product.product_url)
         
         return product.product_id
         
     except BagelPayValidationError as e:
-        print(f"❌ Validation error: {e}")
-        print("   Please check your product data and try again.")
+        log.error("❌ Validation error: %s", e)
+        log.error("   Please check your product data and try again.")
         raise
     except BagelPayAPIError as e:
-        print(f"❌ API error: {e}")
-        print(f"   Status code: {e.status_code}")
+        log.error("❌ API error: %s", e)
+        log.error("   Status code: %s", e.status_code)
         raise
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        log.error("❌ Unexpected error: %s", e)
         raise
 
 
-def list_products(client: BagelPayClient) -> None:
+def list_products(client: Optional[BagelPayClient] = None) -> None:
     """
     List all products with pagination.
     """
-    print("\n📋 Listing products...")
+    if client is None:
+        client = _default_client()
+    
+    log.info("\n📋 Listing products...")
     
     try:
         # List products with pagination
-        products_response = client.list_products(pageNum=1, pageSize=10)
-        
-        print(f"✅ Found {products_response.total} total products")
-        print(f"   Showing {len(products_response.items)} products on this page")
-        
-        for i, product in enumerate(products_response.items, 1):
-            status = "🗄️ Archived" if product.is_archive else "✅ Active"
-            if product.recurring_interval:
-                print(f"   {i}. {product.name} ({product.product_id}) - ${product.price}/{product.recurring_interval} {product.currency} {status}")
-            else:
-                print(f"   {i}. {product.name} ({product.product_id}) - ${product.price} {product.currency} {status}")
-
-        # If there are more pages, show pagination info
-        if products_response.total > len(products_response.items):
-            total_pages = (products_response.total + 9) // 10  # Ceiling division
-            print(f"   📄 Page 1 of {total_pages} (use pagination to see more)")
+        products_response = client.list_products(pageNum=1, pageSize=_PRODUCT_PAGE_SIZE)
+        print_products(products_response, _PRODUCT_PAGE_SIZE)
             
     except BagelPayAPIError as e:
-        print(f"❌ Failed to list products: {e}")
+        log.error("❌ Failed to list products: %s", e)
         raise
 
 
+def print_products(products_response: 'ProductListResponse', page_size: int) -> None:
+    """
+    Print a page of products as a single log record.
+    """
+    if not log.isEnabledFor(logging.INFO):
+        return
+    
+    lines = []
+    lines.append(f"✅ Found {products_response.total} total products")
+    lines.append(f"   Showing {len(products_response.items)} products on this page")
+    
+    for i, product in enumerate(products_response.items, 1):
+        pid, name, price, cur, ri, arch = _PROD_FIELDS(product)
+        lines.append(f"   {i}. {name} ({pid}) - ${price}{'/' + ri if ri else ''} {cur} {'🗄️ Archived' if arch else '✅ Active'}")
+
+    # If there are more pages, show pagination info
+    if products_response.total > len(products_response.items):
+        total_pages = -(-products_response.total // page_size)  # Ceiling division
+        lines.append(f"   📄 Page 1 of {total_pages} (use pagination to see more)")
+    
+    log.info("%s", "\n".join(lines))
+
+
 def get_product_details(client: BagelPayClient, product_id: str) -> None:
     """
     Get detailed information about a specific product.
     """
-    print(f"\n🔍 Getting details for product {product_id}...")
+    log.info("\n🔍 Getting details for product %s...", product_id)
     
     try:
         product = client.get_product(product_id)
         
-        print(f"✅ Product details:")
-        print(f"   Product ID: {product.product_id}")
-        print(f"   Name: {product.name}")
-        print(f"   Description: {product.description}")
+        log.info("✅ Product details:")
+        log.info("   Product ID: %s", product.product_id)
+        log.info("   Name: %s", product.name)
+        log.info("   Description: %s", product.description)
         if product.recurring_interval:
-            print(f"   Price: ${product.price} {product.currency}/{product.recurring_interval}")
+            log.info("   Price: $%s %s/%s", product.price, product.currency, product.recurring_interval)
         else:
-            print(f"   Price: ${product.price} {product.currency}")
-        print(f"   Billing: {product.billing_type}")
-        print(f"   Tax Inclusive: {product.tax_inclusive}")
-        print(f"   Tax Category: {product.tax_category}")
-        print(f"   Status: {'Archived' if product.is_archive else 'Active'}")
-        print(f"   Created: {product.created_at}")
-        print(f"   Updated: {product.updated_at}")
-        print(f"   Product URL: {product.product_url}")
+            log.info("   Price: $%s %s", product.price, product.currency)
+        log.info("   Billing: %s", product.billing_type)
+        log.info("   Tax Inclusive: %s", product.tax_inclusive)
+        log.info("   Tax Category: %s", product.tax_category)
+        log.info("   Status: %s", 'Archived' if product.is_archive else 'Active')
+        log.info("   Created: %s", product.created_at)
+        log.info("   Updated: %s", product.updated_at)
+        log.info("   Product URL: %s", product.product_url)
         
     except BagelPayNotFoundError as e:
-        print(f"❌ Product not found: {e}")
-        print(f"   The product {product_id} does not exist or has been deleted.")
+        log.error("❌ Product not found: %s", e)
+        log.error("   The product %s does not exist or has been deleted.", product_id)
         raise
     except BagelPayAPIError as e:
-        print(f"❌ Failed to get product details: {e}")
+        log.error("❌ Failed to get product details: %s", e)
         raise
 
 
@@ -212,39 +310,40 @@ def update_product(client: BagelPayClient, product_id: str) -> None:
     """
     Update a product's information.
     """
-    print(f"\n✏️ Updating product {product_id}...")
+    log.info("\n✏️ Updating product %s...", product_id)
     
     try:
         # Create update request
+        suffix = str(_RNG.randint(1000, 9999))
         update_request = UpdateProductRequest(
             product_id=product_id,
-            name="New_Product_" + str(random.randint(1000, 9999)),
-            description="New_Description_of_product_" + str(random.randint(1000, 9999)),
-            price=random.uniform(50.5, 1024.5),
+            name="New_Product_" + suffix,
+            description="New_Description_of_product_" + suffix,
+            price=_RNG.uniform(50.5, 1024.5),
             currency="USD",
-            billing_type=random.choice(["subscription", "subscription", "single_payment"]),
+            billing_type=_RNG.choice(_UPDATE_BILLING),
             tax_inclusive=False,
-            tax_category=random.choice(["digital_products", "saas_services", "ebooks"]),
-            recurring_interval=random.choice(["daily", "weekly", "monthly", "3months", "6months"]),
-            trial_days=random.choice([0, 1, 7])
+            tax_category=_RNG.choice(_TAX),
+            recurring_interval=_RNG.choice(_INTERVAL),
+            trial_days=_RNG.choice(_TRIAL)
         )
         
         # Update the product
         updated_product = client.update_product(update_request)
         
-        print(f"✅ Product updated successfully!")
-        print(f"   New name: {updated_product.name}")
-        print(f"   New price: ${updated_product.price} {updated_product.currency}")
-        print(f"   Updated at: {updated_product.updated_at}")
+        log.info("✅ Product updated successfully!")
+        log.info("   New name: %s", updated_product.name)
+        log.info("   New price: $%s %s", updated_product.price, updated_product.currency)
+        log.info("   Updated at: %s", updated_product.updated_at)
         
     except BagelPayValidationError as e:
-        print(f"❌ Validation error during update: {e}")
+        log.error("❌ Validation error during update: %s", e)
         raise
     except BagelPayNotFoundError as e:
-        print(f"❌ Product not found for update: {e}")
+        log.error("❌ Product not found for update: %s", e)
         raise
     except BagelPayAPIError as e:
-        print(f"❌ Failed to update product: {e}")
+        log.error("❌ Failed to update product: %s", e)
         raise
 
 
@@ -252,21 +351,24 @@ def create_checkout_session(client: BagelPayClient, product_id: str) -> str:
     """
     Create a checkout session for a product.
     """
-    print(f"\n💳 Creating checkout session for product {product_id}...")
+    log.info("\n💳 Creating checkout session for product %s...", product_id)
     
     try:
         # Create customer information
         customer = Customer(email="andrew@gettrust.ai")
         
+        # Use one timestamp so request_id and order_id always match
+        request_id = f"req_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        
         # Create checkout request
         checkout_request = CheckoutRequest(
             product_id=product_id,
-            request_id=f"req_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            units=random.choice(["1", "2", "3", "4"]),
+            request_id=request_id,
+            units=_RNG.choice(_UNITS),
             customer=customer,
-            success_url=random.choice([None, "https://yourapp.com/success"]),
+            success_url=_RNG.choice(_SUCCESS_URLS),
             metadata={
-                "order_id": f"req_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                "order_id": request_id,
                 "campaign": "summer_sale",
                 "source": "website"
             }
@@ -275,272 +377,412 @@ def create_checkout_session(client: BagelPayClient, product_id: str) -> str:
         # Create the checkout session
         checkout = client.create_checkout(checkout_request)
         
-        print(f"✅ Checkout session created successfully!")
-        print(f"   Payment ID: {checkout.payment_id}")
-        print(f"   Status: {checkout.status}")
-        print(f"   Checkout URL: {checkout.checkout_url}")
-        print(f"   Expires on: {checkout.expires_on}")
-        print(f"   Success URL: {checkout.success_url}")
+        log.info("✅ Checkout session created successfully!")
+        log.info("   Payment ID: %s", checkout.payment_id)
+        log.info("   Status: %s", checkout.status)
+        log.info("   Checkout URL: %s", checkout.checkout_url)
+        log.info("   Expires on: %s", checkout.expires_on)
+        log.info("   Success URL: %s", checkout.success_url)
         
         return checkout.payment_id
         
     except BagelPayValidationError as e:
-        print(f"❌ Validation error during checkout creation: {e}")
+        log.error("❌ Validation error during checkout creation: %s", e)
         raise
     except BagelPayAPIError as e:
-        print(f"❌ Failed to create checkout session: {e}")
+        log.error("❌ Failed to create checkout session: %s", e)
         raise
 
 
-def list_transactions(client: BagelPayClient) -> None:
+def list_transactions(client: Optional[BagelPayClient] = None) -> None:
     """
     List recent transactions.
     """
-    print("\n💰 Listing recent transactions...")
+    if client is None:
+        client = _default_client()
+    
+    log.info("\n💰 Listing recent transactions...")
     
     try:
         # List transactions with pagination
         transactions_response = client.list_transactions(pageNum=1, pageSize=5)
-        
-        print(f"✅ Found {transactions_response.total} total transactions")
-        print(f"   Showing {len(transactions_response.items)} transactions on this page")
-        
-        for i, transaction in enumerate(transactions_response.items, 1):
-            print(f"   {i}. Transaction {transaction.transaction_id}")
-            print(f"      Amount: ${transaction.amount / 100:.2f} {transaction.currency}")
-            print(f"      Type: {transaction.type}")
-            print(f"      Customer: {transaction.customer.email if transaction.customer else 'N/A'}")
-            print(f"      Created: {transaction.created_at}")
-            if transaction.remark:
-                print(f"      Remark: {transaction.remark}")
-            print()
+        print_transactions(transactions_response)
         
     except BagelPayAPIError as e:
-        print(f"❌ Failed to list transactions: {e}")
+        log.error("❌ Failed to list transactions: %s", e)
         raise
 
 
+def print_transactions(transactions_response: 'TransactionListResponse') -> None:
+    """
+    Print a page of transactions as a single log record.
+    """
+    if not log.isEnabledFor(logging.INFO):
+        return
+    
+    lines = []
+    lines.append(f"✅ Found {transactions_response.total} total transactions")
+    lines.append(f"   Showing {len(transactions_response.items)} transactions on this page")
+    
+    for i, transaction in enumerate(transactions_response.items, 1):
+        tid, amount, cur, typ, customer, created, remark = _TXN_FIELDS(transaction)
+        lines.append(_TXN_TMPL.format_map({
+            "i": i,
+            "tid": tid,
+            "amt": amount / 100,
+            "cur": cur,
+            "typ": typ,
+            "email": customer.email if customer else "N/A",
+            "created": created
+        }))
+        if remark:
+            lines.append(f"      Remark: {remark}")
+        lines.append("")
+    
+    log.info("%s", "\n".join(lines))
+
+
 def archive_and_unarchive_product(client: BagelPayClient, product_id: str) -> None:
     """
     Demonstrate archiving and unarchiving a product.
     """
-    print(f"\n🗄️ Archiving product {product_id}...")
+    log.info("\n🗄️ Archiving product %s...", product_id)
     
     try:
-        # Archive the product
-        archive_result = client.archive_product(product_id)
-        print(f"✅ Product archived successfully!")
-        print(f"   Product ID: {archive_result.product_id}")
-        print(f"   Status: {'Archived' if archive_result.is_archive else 'Active'}")
+        # Both calls go through the client's pooled session, so the
+        # unarchive reuses the connection opened by the archive
+        archive_result = client.set_product_archived(product_id, True)
+        log.info("✅ Product archived successfully!")
+        log.info("   Product ID: %s", archive_result.product_id)
+        log.info("   Status: %s", 'Archived' if archive_result.is_archive else 'Active')
         
         # Unarchive the product
-        print(f"\n📤 Unarchiving product {product_id}...")
-        unarchive_result = client.unarchive_product(product_id)
-        print(f"✅ Product unarchived successfully!")
-        print(f"   Product ID: {unarchive_result.product_id}")
-        print(f"   Status: {'Archived' if unarchive_result.is_archive else 'Active'}")
+        log.info("\n📤 Unarchiving product %s...", product_id)
+        unarchive_result = client.set_product_archived(product_id, False)
+        log.info("✅ Product unarchived successfully!")
+        log.info("   Product ID: %s", unarchive_result.product_id)
+        log.info("   Status: %s", 'Archived' if unarchive_result.is_archive else 'Active')
         
     except BagelPayNotFoundError as e:
-        print(f"❌ Product not found for archive/unarchive: {e}")
+        log.error("❌ Product not found for archive/unarchive: %s", e)
         raise
     except BagelPayAPIError as e:
-        print(f"❌ Failed to archive/unarchive product: {e}")
+        log.error("❌ Failed to archive/unarchive product: %s", e)
         raise
 
 
-def list_subscriptions_basic(client: BagelPayClient) -> None:
+def list_subscriptions_basic(client: Optional[BagelPayClient] = None) -> None:
     """
     Demonstrate basic subscription listing.
     """
-    print("\n🔄 Subscription Management")
-    print("=" * 30)
+    if client is None:
+        client = _default_client()
+    
+    log.info("\n🔄 Subscription Management")
+    log.info(_SEP30)
     
     try:
-        print("\n📋 Listing subscriptions...")
+        log.info("\n📋 Listing subscriptions...")
+        # One page carries both the first 3 to show and the total
         subscriptions_response = client.list_subscriptions(pageNum=1, pageSize=5)
-        
-        print(f"Total subscriptions: {subscriptions_response.total}")
-        
-        if subscriptions_response.items:
-            print("\nRecent subscriptions:")
-            for subscription in subscriptions_response.items[:3]:  # Show first 3
-                print(f"  📦 {subscription.subscription_id}")
-                print(f"     Status: {subscription.status}")
-                print(f"     Product: {subscription.product_name}")
-                print(f"     Customer: {subscription.customer.email}")
-                print(f"     Amount: ${subscription.next_billing_amount}/{subscription.recurring_interval}")
-                print(f"     Payment method: {subscription.payment_method}")
-                print(f"     Subscription Started: {subscription.created_at}")
-                if subscription.trial_end:
-                    print(f"     Trial Start: {subscription.trial_start}")
-                    print(f"     Trial End: {subscription.trial_end}")
-                    print(f"     Next Billing Amount: {subscription.next_billing_amount}/{subscription.recurring_interval}")
-                    print(f"     Next Billing Date: {subscription.trial_end}")
-                else:
-                    print(f"     Next Billing Amount: {subscription.next_billing_amount}/{subscription.recurring_interval}")
-                    print(f"     Next Billing Date: {subscription.billing_period_end}")
-                print()
-        else:
-            print("   No subscriptions found.")
-            print("   💡 Create subscription products and checkout sessions to see subscriptions here.")
+        print_subscriptions(subscriptions_response.items[:3], total=subscriptions_response.total)
     
     except BagelPayAPIError as e:
-        print(f"❌ API Error: {e.message} (Code: {e.error_code})")
+        log.error("❌ API Error: %s (Code: %s)", e.message, e.error_code)
     except Exception as e:
-        print(f"❌ Error: {e}")
+        log.error("❌ Error: %s", e)
 
 
-def list_customers_basic(client: BagelPayClient) -> None:
+def print_subscriptions(subscriptions: List[Subscription], total: Optional[int] = None) -> None:
+    """
+    Print recent subscriptions as a single log record.
+    """
+    if not log.isEnabledFor(logging.INFO):
+        return
+    
+    lines = []
+    if total is not None:
+        lines.append(f"Total subscriptions: {total}")
+    
+    if subscriptions:
+        lines.append("\nRecent subscriptions:")
+        for subscription in subscriptions:
+            (sid, status, product_name, email, amount, interval, method,
+             created, trial_start, trial_end, period_end) = _SUB_FIELDS(subscription)
+            lines.append(
+                f"  📦 {sid}\n"
+                f"     Status: {status}\n"
+                f"     Product: {product_name}\n"
+                f"     Customer: {email}\n"
+                f"     Amount: ${amount}/{interval}\n"
+                f"     Payment method: {method}\n"
+                f"     Subscription Started: {created}"
+            )
+            if trial_end:
+                lines.append(f"     Trial Start: {trial_start}\n     Trial End: {trial_end}")
+            lines.append(
+                f"     Next Billing Amount: {amount}/{interval}\n"
+                f"     Next Billing Date: {trial_end or period_end}\n"
+            )
+    else:
+        lines.append("   No subscriptions found.")
+        lines.append("   💡 Create subscription products and checkout sessions to see subscriptions here.")
+    
+    log.info("%s", "\n".join(lines))
+
+
+def list_customers_basic(client: Optional[BagelPayClient] = None) -> None:
     """
     Demonstrate basic customer listing.
     """
-    print("\n👥 Customer Management")
-    print("=" * 30)
+    if client is None:
+        client = _default_client()
+    
+    log.info("\n👥 Customer Management")
+    log.info(_SEP30)
     
     try:
-        print("\n📋 Listing customers...")
+        log.info("\n📋 Listing customers...")
         customers_response = client.list_customers(pageNum=1, pageSize=5)
-        
-        print(f"Total customers: {customers_response.total}")
-        
-        if customers_response.items:
-            print("\nRecent customers:")
-            total_revenue = 0
-            for customer in customers_response.items[:3]:  # Show first 3
-                print(f"  👤 {customer.name} ({customer.email})")
-                print(f"     Subscriptions: {customer.subscriptions}")
-                print(f"     Total Spend: ${customer.total_spend / 100:.2f}")
-                total_revenue += customer.total_spend
-                print()
-            
-            print(f"Revenue from shown customers: ${total_revenue / 100:.2f}")
-        else:
-            print("   No customers found.")
-            print("   💡 Create checkout sessions to see customers here.")
+        print_customers(customers_response.items[:3], total=customers_response.total)
     
     except BagelPayAPIError as e:
-        print(f"❌ API Error: {e.message} (Code: {e.error_code})")
+        log.error("❌ API Error: %s (Code: %s)", e.message, e.error_code)
     except Exception as e:
-        print(f"❌ Error: {e}")
+        log.error("❌ Error: %s", e)
+
+
+def print_customers(customers: List['CustomerData'], total: Optional[int] = None) -> None:
+    """
+    Print recent customers as a single log record.
+    """
+    if not log.isEnabledFor(logging.INFO):
+        return
+    
+    lines = []
+    if total is not None:
+        lines.append(f"Total customers: {total}")
+    
+    if customers:
+        lines.append("\nRecent customers:")
+        total_revenue = 0
+        for customer in customers:
+            name, email, subscriptions, spend = _CUST_FIELDS(customer)
+            lines.append(
+                f"  👤 {name} ({email})\n"
+                f"     Subscriptions: {subscriptions}\n"
+                f"     Total Spend: ${spend / 100:.2f}\n"
+            )
+            total_revenue += spend
+        
+        lines.append(f"Revenue from shown customers: ${total_revenue / 100:.2f}")
+    else:
+        lines.append("   No customers found.")
+        lines.append("   💡 Create checkout sessions to see customers here.")
+    
+    log.info("%s", "\n".join(lines))
+
+
+def _fetch_overview_in_threads(client: BagelPayClient) -> list:
+    """
+    Run the four independent list calls on a thread pool.
+    
+    Used when httpx is not installed. The sync client's pooled session is
+    shared by the workers and the GIL is released during socket I/O, so
+    the calls still overlap.
+    """
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(client.list_products, pageNum=1, pageSize=_PRODUCT_PAGE_SIZE),
+            executor.submit(client.list_transactions, pageNum=1, pageSize=5),
+            executor.submit(client.list_subscriptions, pageNum=1, pageSize=5),
+            executor.submit(client.list_customers, pageNum=1, pageSize=5)
+        ]
+        return [future.result() for future in futures]
 
 
-def get_subscription_details(client: BagelPayClient) -> None:
+async def list_account_overview(client: BagelPayClient) -> None:
+    """
+    Fetch products, transactions, subscriptions and customers concurrently.
+    
+    The four list calls are independent, so they are issued together on an
+    AsyncBagelPayClient (or a thread pool when httpx is not installed) and
+    the run waits for the slowest one instead of the sum of all four.
+    Results are printed in a fixed order afterwards.
+    """
+    log.info("\n⚡ Fetching products, transactions, subscriptions and customers concurrently...")
+    
+    try:
+        async_client = AsyncBagelPayClient(
+            api_key=client.api_key,
+            base_url=client.base_url,
+            timeout=client.timeout
+        )
+    except BagelPayError:
+        # httpx is not installed
+        responses = _fetch_overview_in_threads(client)
+    else:
+        async with async_client:
+            responses = await asyncio.gather(
+                async_client.list_products(pageNum=1, pageSize=_PRODUCT_PAGE_SIZE),
+                async_client.list_transactions(pageNum=1, pageSize=5),
+                async_client.list_subscriptions(pageNum=1, pageSize=5),
+                async_client.list_customers(pageNum=1, pageSize=5)
+            )
+    
+    (
+        products_response,
+        transactions_response,
+        subscriptions_response,
+        customers_response
+    ) = responses
+    
+    log.info("\n📋 Listing products...")
+    print_products(products_response, _PRODUCT_PAGE_SIZE)
+    
+    log.info("\n💰 Listing recent transactions...")
+    print_transactions(transactions_response)
+    
+    log.info("\n🔄 Subscription Management")
+    log.info(_SEP30)
+    print_subscriptions(subscriptions_response.items[:3], total=subscriptions_response.total)
+    
+    log.info("\n👥 Customer Management")
+    log.info(_SEP30)
+    print_customers(customers_response.items[:3], total=customers_response.total)
+
+
+def get_subscription_details(client: Optional[BagelPayClient] = None) -> None:
     """
     Demonstrate getting detailed information about a specific subscription.
     """
-    print("\n🔍 Getting subscription details example...")
+    if client is None:
+        client = _default_client()
+    
+    log.info("\n🔍 Getting subscription details example...")
     
     try:
         # Get subscription details example
         subscriptions_response = client.list_subscriptions()
-        active_subscriptions = [sub for sub in subscriptions_response.items if sub.status in ['active', 'trialing']]
+        active_subscription = next(
+            (sub for sub in subscriptions_response.items if sub.status in _ACTIVE_STATES), None
+        )
         
-        if not active_subscriptions:
-            print("   No active subscriptions found to demonstrate details.")
+        if active_subscription is None:
+            log.info("   No active subscriptions found to demonstrate details.")
             return
             
-        subscription_id = active_subscriptions[0].subscription_id
-        print(f"   Using subscription {subscription_id} for demonstration...")
+        subscription_id = active_subscription.subscription_id
+        log.info("   Using subscription %s for demonstration...", subscription_id)
         
         subscription = client.get_subscription(subscription_id)
         
-        print(f"✅ Subscription details:")
-        print(f"   Subscription ID: {subscription.subscription_id}")
-        print(f"   Status: {subscription.status}")
-        print(f"   Product: {subscription.product_name} (ID: {subscription.product_id})")
-        print(f"   Customer: {subscription.customer.email}")
-        print(f"   Payment Method: {subscription.payment_method}")
-        print(f"   Amount: ${subscription.next_billing_amount}/{subscription.recurring_interval}")
-        print(f"   Created: {subscription.created_at}")
-        print(f"   Updated: {subscription.updated_at}")
+        log.info("✅ Subscription details:")
+        log.info("   Subscription ID: %s", subscription.subscription_id)
+        log.info("   Status: %s", subscription.status)
+        log.info("   Product: %s (ID: %s)", subscription.product_name, subscription.product_id)
+        log.info("   Customer: %s", subscription.customer.email)
+        log.info("   Payment Method: %s", subscription.payment_method)
+        log.info("   Amount: $%s/%s", subscription.next_billing_amount, subscription.recurring_interval)
+        log.info("   Created: %s", subscription.created_at)
+        log.info("   Updated: %s", subscription.updated_at)
         
         if subscription.trial_start and subscription.trial_end:
-            print(f"   Trial Period: {subscription.trial_start} to {subscription.trial_end}")
+            log.info("   Trial Period: %s to %s", subscription.trial_start, subscription.trial_end)
         
         if subscription.billing_period_start and subscription.billing_period_end:
-            print(f"   Current Billing Period: {subscription.billing_period_start} to {subscription.billing_period_end}")
+            log.info("   Current Billing Period: %s to %s", subscription.billing_period_start, subscription.billing_period_end)
         
         if subscription.cancel_at:
-            print(f"   Scheduled Cancellation: {subscription.cancel_at}")
+            log.info("   Scheduled Cancellation: %s", subscription.cancel_at)
         
         if subscription.remark:
-            print(f"   Remark: {subscription.remark}")
+            log.info("   Remark: %s", subscription.remark)
         
     except BagelPayNotFoundError as e:
-        print(f"❌ Subscription not found: {e}")
-        print(f"   The subscription does not exist or has been deleted.")
+        log.error("❌ Subscription not found: %s", e)
+        log.error("   The subscription does not exist or has been deleted.")
         raise
     except BagelPayAPIError as e:
-        print(f"❌ Failed to get subscription details: {e}")
+        log.error("❌ Failed to get subscription details: %s", e)
         raise
 
 
-def cancel_subscription_example(client: BagelPayClient) -> None:
+def cancel_subscription_example(client: Optional[BagelPayClient] = None) -> None:
     """
     Demonstrate canceling a subscription.
     """
-    print("\n❌ Cancel subscription example...")
+    if client is None:
+        client = _default_client()
+    
+    log.info("\n❌ Cancel subscription example...")
     
     try:
         # Cancel subscription example
         subscriptions_response = client.list_subscriptions()
-        active_subscriptions = [sub for sub in subscriptions_response.items if sub.status in ['active', 'trialing']]
+        active_subscription = next(
+            (sub for sub in subscriptions_response.items if sub.status in _ACTIVE_STATES), None
+        )
         
-        if not active_subscriptions:
-            print("   No active subscriptions found to demonstrate cancellation.")
-            print("   💡 Skipping cancellation example for safety.")
+        if active_subscription is None:
+            log.info("   No active subscriptions found to demonstrate cancellation.")
+            log.info("   💡 Skipping cancellation example for safety.")
             return
             
-        subscription_id = active_subscriptions[0].subscription_id
+        subscription_id = active_subscription.subscription_id
         
         canceled_subscription = client.cancel_subscription(subscription_id)
-        print(f"✅ Subscription canceled successfully!")
-        print(f"   Subscription ID: {canceled_subscription.subscription_id}")
-        print(f"   Status: {canceled_subscription.status}")
-        print(f"   Product: {canceled_subscription.product_name}")
-        print(f"   Customer: {canceled_subscription.customer.email}")
+        log.info("✅ Subscription canceled successfully!")
+        log.info("   Subscription ID: %s", canceled_subscription.subscription_id)
+        log.info("   Status: %s", canceled_subscription.status)
+        log.info("   Product: %s", canceled_subscription.product_name)
+        log.info("   Customer: %s", canceled_subscription.customer.email)
         if canceled_subscription.cancel_at:
-             print(f"   Cancellation Date: {canceled_subscription.cancel_at}")
-        print(f"   💡 The subscription will remain active until the end of the current billing period.")
+             log.info("   Cancellation Date: %s", canceled_subscription.cancel_at)
+        log.info("   💡 The subscription will remain active until the end of the current billing period.")
         
     except BagelPayNotFoundError as e:
-        print(f"❌ Subscription not found for cancellation: {e}")
-        print(f"   The subscription does not exist or has already been canceled.")
+        log.error("❌ Subscription not found for cancellation: %s", e)
+        log.error("   The subscription does not exist or has already been canceled.")
         raise
     except BagelPayAPIError as e:
-        print(f"❌ Failed to cancel subscription: {e}")
+        log.error("❌ Failed to cancel subscription: %s", e)
         if e.error_code:
-            print(f"   Error code: {e.error_code}")
+            log.info("   Error code: %s", e.error_code)
         raise
 
 
-def demonstrate_error_handling(client: BagelPayClient) -> None:
+def demonstrate_error_handling(client: Optional[BagelPayClient] = None) -> None:
     """
     Demonstrate various error handling scenarios.
     
     The SDK supports the API error format: {"msg": "Validation failed", "code": 500}
     """
-    print("\n🚨 Demonstrating error handling...")
-    print("   📝 Note: SDK handles API error format {msg, code}")
+    if client is None:
+        client = _default_client()
+    
+    log.info("\n🚨 Demonstrating error handling...")
+    log.info("   📝 Note: SDK handles API error format {msg, code}")
     
     # Try to get a non-existent product
     try:
-        print("   Trying to get non-existent product...")
+        log.info("   Trying to get non-existent product...")
         client.get_product("nonexistent_product_id")
     except BagelPayNotFoundError as e:
-        print(f"   ✅ Caught expected NotFoundError: {e}")
+        log.info("   ✅ Caught expected NotFoundError: %s", e)
     except BagelPayAPIError as e:
-        print(f"   ✅ Caught API error: {e} (status: {e.status_code})")
+        log.info("   ✅ Caught API error: %s (status: %s)", e, e.status_code)
         if e.error_code:
-            print(f"      Error code: {e.error_code}")
-        if hasattr(e, 'api_error') and e.api_error:
-            print(f"      API Error details: {e.api_error.message} (code: {e.api_error.code})")
+            log.info("      Error code: %s", e.error_code)
+        api_err = getattr(e, "api_error", None)
+        if api_err:
+            log.info("      API Error details: %s (code: %s)", api_err.message, api_err.code)
     except Exception as e:
-        print(f"   ✅ Caught error: {e}")
+        log.info("   ✅ Caught error: %s", e)
     
     # Try to create a product with invalid data
     try:
-        print("   Trying to create product with invalid price...")
+        log.info("   Trying to create product with invalid price...")
         invalid_request = CreateProductRequest(
             name="Invalid Product",
             description="This product has invalid data",
@@ -554,36 +796,33 @@ def demonstrate_error_handling(client: BagelPayClient) -> None:
         )
         client.create_product(invalid_request)
     except BagelPayValidationError as e:
-        print(f"   ✅ Caught expected ValidationError: {e}")
+        log.info("   ✅ Caught expected ValidationError: %s", e)
         if e.error_code:
-            print(f"      Error code: {e.error_code}")
+            log.info("      Error code: %s", e.error_code)
     except BagelPayAPIError as e:
-        print(f"   ✅ Caught API error: {e} (status: {e.status_code})")
+        log.info("   ✅ Caught API error: %s (status: %s)", e, e.status_code)
         if e.error_code:
-            print(f"      Error code: {e.error_code}")
+            log.info("      Error code: %s", e.error_code)
     except Exception as e:
-        print(f"   ✅ Caught error: {e}")
+        log.info("   ✅ Caught error: %s", e)
 
 
-def main():
+async def main():
     """
     Main function demonstrating the complete BagelPay SDK usage.
     """
-    print("🥯 BagelPay SDK - Basic Usage Example")
-    print("=" * 50)
+    log.info("🥯 BagelPay SDK - Basic Usage Example")
+    log.info(_SEP50)
     
     try:
-        # Initialize the client
-        client = get_client()
+        # Initialize the shared client
+        client = _default_client()
         
         # Use the client as a context manager for automatic cleanup
         with client:
             # Create a sample product
             product_id = create_sample_product(client)
             
-            # List all products
-            list_products(client)
-            
             # Get product details
             get_product_details(client, product_id)
             
@@ -596,11 +835,8 @@ def main():
             # Create a checkout session
             payment_id = create_checkout_session(client, product_id)
             
-            # List transactions
-            list_transactions(client)
-            
-            # List subscriptions
-            list_subscriptions_basic(client)
+            # List products, transactions, subscriptions and customers concurrently
+            await list_account_overview(client)
             
             # Get subscription details example
             get_subscription_details(client)
@@ -608,31 +844,39 @@ def main():
             # Cancel subscription example
             # cancel_subscription_example(client)
             
-            # List customers
-            list_customers_basic(client)
-            
             # Demonstrate error handling
             demonstrate_error_handling(client)
         
-        print("\n✅ All operations completed successfully!")
-        print("\n💡 Tips:")
-        print("   - Always use the client as a context manager for proper cleanup")
-        print("   - Handle specific exceptions for better error management")
-        print("   - Use pagination for large datasets")
-        print("   - Store product IDs and payment IDs for future reference")
-        print("   - Check the API documentation for more advanced features")
+        log.info("\n✅ All operations completed successfully!")
+        log.info("\n💡 Tips:")
+        log.info("   - Always use the client as a context manager for proper cleanup")
+        log.info("   - Handle specific exceptions for better error management")
+        log.info("   - Use pagination for large datasets")
+        log.info("   - Store product IDs and payment IDs for future reference")
+        log.info("   - Check the API documentation for more advanced features")
         
     except BagelPayAuthenticationError as e:
-        print(f"\n❌ Authentication failed: {e}")
-        print("   Please check your API key and try again.")
+        log.error("\n❌ Authentication failed: %s", e)
+        log.error("   Please check your API key and try again.")
         sys.exit(1)
     except BagelPayError as e:
-        print(f"\n❌ BagelPay SDK error: {e}")
+        log.error("\n❌ BagelPay SDK error: %s", e)
         sys.exit(1)
     except Exception as e:
-        print(f"\n❌ Unexpected error: {e}")
+        log.error("\n❌ Unexpected error: %s", e)
         sys.exit(1)
+    finally:
+        # The with block closed the shared client; don't hand it out again
+        _default_client.cache_clear()
 
 
 if __name__ == "__main__":
-    main()
+    # Pass --quiet to only show errors; INFO messages are then never formatted
+    logging.basicConfig(
+        level=logging.WARNING if "--quiet" in sys.argv[1:] else logging.INFO,
+        format="%(message)s",
+        stream=sys.stdout
+    )
+    # httpx logs every request at INFO; keep the example output readable
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    asyncio.run(main())
@@ -14,26 +14,39 @@ Before running this script:
    export BAGELPAY_API_KEY="your_api_key_here"
    
 2. Install the required dependencies:
-   pip install bagelpay
+   pip install bagelpay[async]
 """
 
 import os
+import re
 import sys
 import random
+import asyncio
+import functools
 from datetime import datetime
+from uuid import uuid4
 from typing import Optional
 
-# Add the parent directory to the path to import the SDK
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Use the SDK from this checkout when there is one: the examples rely on APIs
+# newer than the published release
+_SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+if os.path.isdir(os.path.join(_SRC_DIR, 'bagelpay')):
+    sys.path.insert(0, _SRC_DIR)
 
-from src.bagelpay.client import BagelPayClient
-from src.bagelpay.models import (
+if __package__:
+    from ._common import _TEST_MODE
+else:
+    from _common import _TEST_MODE
+
+from bagelpay.client import BagelPayClient
+from bagelpay.async_client import AsyncBagelPayClient
+from bagelpay.models import (
     CheckoutRequest,
     CheckoutResponse,
     Customer,
     CreateProductRequest
 )
-from src.bagelpay.exceptions import (
+from bagelpay.exceptions import (
     BagelPayError,
     BagelPayAPIError,
     BagelPayAuthenticationError,
@@ -41,11 +54,51 @@ from src.bagelpay.exceptions import (
     BagelPayNotFoundError
 )
 
+# Local validation rules, checked before sending a request
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Shared defaults for the example products; each builder overrides what differs
+_PRODUCT_DEFAULTS = {
+    "currency": "USD",
+    "billing_type": "single_payment",
+    "tax_inclusive": True,
+    "tax_category": "digital_products",
+    "recurring_interval": "none",
+    "trial_days": 0
+}
+
+
+def _product_request(**fields) -> CreateProductRequest:
+    """
+    Build a CreateProductRequest from _PRODUCT_DEFAULTS and the given fields.
+    
+    Returns:
+        CreateProductRequest: Validated product creation data
+    """
+    return CreateProductRequest(**{**_PRODUCT_DEFAULTS, **fields})
+
+
+def _new_request_id() -> str:
+    """
+    Build a request id that stays unique across checkouts created in the same second.
+    
+    The flows run concurrently, so a timestamp alone would give them all the same
+    request_id and order_id.
+    
+    Returns:
+        str: Request id such as req_20250101_120000_1a2b3c4d
+    """
+    return f"req_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid4().hex[:8]}"
+
 
+@functools.lru_cache(maxsize=4)
 def get_client(api_key: Optional[str] = None, base_url: Optional[str] = None) -> BagelPayClient:
     """
     Initialize and return a BagelPay client.
     
+    Clients are cached per (api_key, base_url), so repeated calls in the
+    same process reuse one client and its connection pool.
+    
     Args:
         api_key (Optional[str]): Your BagelPay API key. If not provided, will read from BAGELPAY_API_KEY environment variable.
         base_url (Optional[str]): Custom base URL for the API. If not provided, will use the default URL based on test_mode.
@@ -70,13 +123,10 @@ def get_client(api_key: Optional[str] = None, base_url: Optional[str] = None) ->
             "set BAGELPAY_API_KEY environment variable with: export BAGELPAY_API_KEY='your_api_key_here'"
         )
     
-    # Use test mode by default for examples
-    test_mode = os.getenv('BAGELPAY_TEST_MODE', 'true').lower() != 'false'
-    
     # Initialize the client
     client_kwargs = {
         'api_key': api_key,
-        'test_mode': test_mode,
+        'test_mode': _TEST_MODE,
         'timeout': 30  # 30 seconds timeout
     }
     
@@ -87,49 +137,78 @@ def get_client(api_key: Optional[str] = None, base_url: Optional[str] = None) ->
     client = BagelPayClient(**client_kwargs)
     
     print(f"✅ BagelPay client initialized")
-    print(f"   Mode: {'Test' if test_mode else 'Live'}")
+    print(f"   Mode: {'Test' if _TEST_MODE else 'Live'}")
     print(f"   Base URL: {client.base_url}")
     print(f"   API Key: {api_key[:8]}...{api_key[-4:]}")
     
     return client
 
 
-def create_simple_checkout(client: BagelPayClient) -> str:
+def get_async_client(client: BagelPayClient) -> AsyncBagelPayClient:
+    """
+    Build an AsyncBagelPayClient with the same settings as a sync client.
+    
+    Args:
+        client (BagelPayClient): Client returned by get_client()
+    
+    Returns:
+        AsyncBagelPayClient: Async client for running independent calls concurrently
+    """
+    return AsyncBagelPayClient(
+        api_key=client.api_key,
+        base_url=client.base_url,
+        timeout=client.timeout
+    )
+
+
+def validate_customer(customer: Customer) -> None:
+    """
+    Check customer data locally before sending it to the API.
+    
+    Args:
+        customer (Customer): Customer data for a checkout
+    
+    Raises:
+        BagelPayValidationError: If the email address is malformed
+    """
+    if not _EMAIL_RE.match(customer.email):
+        raise BagelPayValidationError(f"Invalid email address: {customer.email}")
+
+
+async def create_simple_checkout(client: AsyncBagelPayClient) -> str:
     """Create a simple one-time payment checkout session."""
     print("\n💳 Creating a simple checkout session...")
     
     try:
         # First create a product for checkout
-        product_request = CreateProductRequest(
+        product_request = _product_request(
             name="Product_" + str(random.randint(1000, 9999)),
             description="One-time premium software license",
             price=99.99,
-            currency="USD",
-            billing_type="single_payment",
-            tax_inclusive=True,
-            tax_category="digital_products",
-            recurring_interval="daily",
-            trial_days=0
+            recurring_interval="daily"
         )
-        product = client.create_product(product_request)
+        product = await client.create_product(product_request)
         
         # Create customer
         customer = Customer(email="andrew@gettrust.ai")
         
+        req_id = _new_request_id()
+        units = str(random.randint(1, 4))
+        
         checkout_request = CheckoutRequest(
             product_id=product.product_id,
-            request_id=f"req_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            units=random.choice(["1", "2", "3", "4"]),
+            request_id=req_id,
+            units=units,
             customer=customer,
             success_url="https://yoursite.com/success",
             metadata={
-                "order_id": f"req_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                "order_id": req_id,
                 "campaign": "simple_checkout",
                 "source": "website"
             }
         )
         
-        checkout_response = client.create_checkout(checkout_request)
+        checkout_response = await client.create_checkout(checkout_request)
         
         print(f"✅ Checkout session created successfully!")
         print(f"   Payment ID: {checkout_response.payment_id}")
@@ -150,7 +229,7 @@ def create_simple_checkout(client: BagelPayClient) -> str:
         raise
 
 
-def create_checkout_with_customer(client: BagelPayClient) -> str:
+async def create_checkout_with_customer(client: AsyncBagelPayClient) -> str:
     """Create a checkout session with customer information."""
     print("\n👤 Creating checkout session with customer info...")
     
@@ -161,33 +240,30 @@ def create_checkout_with_customer(client: BagelPayClient) -> str:
         )
         
         # Create a product for checkout
-        product_request = CreateProductRequest(
+        product_request = _product_request(
             name="Product_" + str(random.randint(1000, 9999)),
             description="Annual Pro Subscription with full features",
-            price=149.99,
-            currency="USD",
-            billing_type="single_payment",
-            tax_inclusive=True,
-            tax_category="digital_products",
-            recurring_interval="none",
-            trial_days=0
+            price=149.99
         )
-        product = client.create_product(product_request)
+        product = await client.create_product(product_request)
+        
+        req_id = _new_request_id()
+        units = str(random.randint(1, 4))
         
         checkout_request = CheckoutRequest(
             product_id=product.product_id,
-            request_id=f"req_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            units=random.choice(["1", "2", "3", "4"]),
+            request_id=req_id,
+            units=units,
             customer=customer,
             success_url="https://yoursite.com/success",
             metadata={
-                "order_id": f"req_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                "order_id": req_id,
                 "campaign": "customer_checkout",
                 "source": "website"
             }
         )
         
-        checkout_response = client.create_checkout(checkout_request)
+        checkout_response = await client.create_checkout(checkout_request)
         
         print(f"✅ Checkout session with customer created successfully!")
         print(f"   Payment ID: {checkout_response.payment_id}")
@@ -209,7 +285,7 @@ def create_checkout_with_customer(client: BagelPayClient) -> str:
         raise
 
 
-def create_subscription_checkout(client: BagelPayClient) -> str:
+async def create_subscription_checkout(client: AsyncBagelPayClient) -> str:
     """Create a checkout session for a subscription."""
     print("\n🔄 Creating subscription checkout session...")
     
@@ -219,33 +295,33 @@ def create_subscription_checkout(client: BagelPayClient) -> str:
         )
         
         # Create a subscription product
-        product_request = CreateProductRequest(
+        product_request = _product_request(
             name="Product_" + str(random.randint(1000, 9999)),
             description="Monthly SaaS Subscription with premium features",
             price=29.99,
-            currency="USD",
             billing_type="subscription",
-            tax_inclusive=True,
-            tax_category="digital_products",
             recurring_interval="monthly",
             trial_days=7
         )
-        product = client.create_product(product_request)
+        product = await client.create_product(product_request)
+        
+        req_id = _new_request_id()
+        units = str(random.randint(1, 4))
         
         checkout_request = CheckoutRequest(
             product_id=product.product_id,
-            request_id=f"req_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            units=random.choice(["1", "2", "3", "4"]),
+            request_id=req_id,
+            units=units,
             customer=customer,
             success_url="https://yoursite.com/welcome",
             metadata={
-                "order_id": f"req_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                "order_id": req_id,
                 "campaign": "subscription_checkout",
                 "source": "website"
             }
         )
         
-        checkout_response = client.create_checkout(checkout_request)
+        checkout_response = await client.create_checkout(checkout_request)
         
         print(f"✅ Subscription checkout session created successfully!")
         print(f"   Payment ID: {checkout_response.payment_id}")
@@ -280,21 +356,28 @@ def list_recent_transactions(client: BagelPayClient) -> None:
         print(f"❌ Error listing transactions: {str(e)}")
 
 
-def demonstrate_payment_flows(client: BagelPayClient) -> None:
-    """Demonstrate different payment flows."""
+async def demonstrate_payment_flows(client: AsyncBagelPayClient) -> None:
+    """
+    Demonstrate different payment flows.
+    
+    The three flows are independent, so they run concurrently; within each
+    flow the product is still created before its checkout.
+    """
     print("\n🔄 Demonstrating payment flows...")
     
     try:
-        # Simple one-time payment
-        simple_payment_id = create_simple_checkout(client)
-        print(f"   Simple payment created: {simple_payment_id}")
+        (
+            simple_payment_id,
+            customer_payment_id,
+            subscription_payment_id
+        ) = await asyncio.gather(
+            create_simple_checkout(client),         # Simple one-time payment
+            create_checkout_with_customer(client),  # Payment with customer info
+            create_subscription_checkout(client)    # Subscription payment
+        )
         
-        # Payment with customer info
-        customer_payment_id = create_checkout_with_customer(client)
+        print(f"   Simple payment created: {simple_payment_id}")
         print(f"   Customer payment created: {customer_payment_id}")
-        
-        # Subscription payment
-        subscription_payment_id = create_subscription_checkout(client)
         print(f"   Subscription payment created: {subscription_payment_id}")
         
         print("\n✅ All payment flows demonstrated successfully!")
@@ -308,7 +391,7 @@ def demonstrate_error_handling(client: BagelPayClient) -> None:
     print("\n⚠️  Demonstrating error handling...")
     
     try:
-        # Test with invalid data
+        # Test with invalid data (rejected when the request is built, nothing is sent)
         print("\n1. Testing with invalid product data...")
         try:
             invalid_product = CreateProductRequest(
@@ -328,35 +411,33 @@ def demonstrate_error_handling(client: BagelPayClient) -> None:
         except Exception as e:
             print(f"   ⚠️  Unexpected error type: {str(e)}")
         
-        # Test with invalid customer data
+        # Test with invalid customer data (caught locally, no request is sent)
         print("\n2. Testing with invalid customer data...")
         try:
             invalid_customer = Customer(
                 email="invalid-email",  # Invalid email format
             )
+            validate_customer(invalid_customer)
             
             # Create a valid product first
-            product_request = CreateProductRequest(
+            product_request = _product_request(
                 name="Product_" + str(random.randint(1000, 9999)),
                 description="Annual Pro Subscription with full features",
-                price=149.99,
-                currency="USD",
-                billing_type="single_payment",
-                tax_inclusive=True,
-                tax_category="digital_products",
-                recurring_interval="none",
-                trial_days=0
+                price=149.99
             )
             product = client.create_product(product_request)
             
+            req_id = _new_request_id()
+            units = str(random.randint(1, 4))
+            
             checkout_request = CheckoutRequest(
                 product_id=product.product_id,
-                request_id=f"req_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                units=random.choice(["1", "2", "3", "4"]),
+                request_id=req_id,
+                units=units,
                 customer=invalid_customer,
                 success_url="https://yoursite.com/success",
                 metadata={
-                    "order_id": f"req_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                    "order_id": req_id,
                     "campaign": "error_handling_test",
                     "source": "website"
                 }
@@ -367,13 +448,29 @@ def demonstrate_error_handling(client: BagelPayClient) -> None:
         except Exception as e:
             print(f"   ⚠️  Unexpected error type: {str(e)}")
         
+        # Passes the local checks, so the server-side validation is exercised
+        print("\n3. Sending a product with an unknown tax category to the API...")
+        try:
+            client.create_product(_product_request(
+                name="Product_" + str(random.randint(1000, 9999)),
+                description="Invalid product",
+                price=10.00,
+                tax_category="invalid"  # Only the API knows the valid categories
+            ))
+        except BagelPayValidationError as e:
+            print(f"   ✅ Caught validation error as expected: {e.message}")
+        except BagelPayAPIError as e:
+            print(f"   ✅ Caught API error as expected: {e.message}")
+        except Exception as e:
+            print(f"   ⚠️  Unexpected error type: {str(e)}")
+        
         print("\n✅ Error handling demonstration completed!")
         
     except Exception as e:
         print(f"❌ Error in error handling demo: {str(e)}")
 
 
-def main():
+async def main():
     """Main function to run all checkout and payment examples."""
     print("🚀 BagelPay SDK - Checkout and Payments Examples")
     print("=======================================================")
@@ -383,11 +480,14 @@ def main():
         client = get_client()
         
         # Run examples
-        create_simple_checkout(client)
-        create_checkout_with_customer(client)
-        create_subscription_checkout(client)
-        list_recent_transactions(client)
-        demonstrate_payment_flows(client)
+        async with get_async_client(client) as async_client:
+            await asyncio.gather(
+                create_simple_checkout(async_client),
+                create_checkout_with_customer(async_client),
+                create_subscription_checkout(async_client)
+            )
+            list_recent_transactions(client)
+            await demonstrate_payment_flows(async_client)
         demonstrate_error_handling(client)
         
         print("\n🎉 All checkout and payment examples completed successfully!")
@@ -402,7 +502,12 @@ def main():
     except Exception as e:
         print(f"❌ Unexpected error: {str(e)}")
         sys.exit(1)
+    finally:
+        # Clean up, and drop the closed client so get_client() builds a fresh one
+        if 'client' in locals():
+            client.close()
+            get_client.cache_clear()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
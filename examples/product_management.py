@@ -11,7 +11,7 @@ This example demonstrates product management operations including:
 - Error handling for product operations
 
 Before running this example:
-1. Install the SDK: pip install bagelpay
+1. Install the SDK: pip install bagelpay[async]
 2. Set your API key as an environment variable: export BAGELPAY_API_KEY="your_api_key_here"
 3. Optionally set test mode: export BAGELPAY_TEST_MODE="false" (defaults to true)
 """
@@ -19,19 +19,31 @@ Before running this example:
 import os
 import sys
 import random
+import asyncio
+import functools
+import io
 from datetime import datetime
 from typing import Optional
 
-# Add the parent directory to the path to import the SDK
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Use the SDK from this checkout when there is one: the examples rely on APIs
+# newer than the published release
+_SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+if os.path.isdir(os.path.join(_SRC_DIR, 'bagelpay')):
+    sys.path.insert(0, _SRC_DIR)
 
-from src.bagelpay.client import BagelPayClient
-from src.bagelpay.models import (
+if __package__:
+    from ._common import _TEST_MODE
+else:
+    from _common import _TEST_MODE
+
+from bagelpay.client import BagelPayClient
+from bagelpay.async_client import AsyncBagelPayClient
+from bagelpay.models import (
     CreateProductRequest,
     UpdateProductRequest,
     Product
 )
-from src.bagelpay.exceptions import (
+from bagelpay.exceptions import (
     BagelPayError,
     BagelPayAPIError,
     BagelPayAuthenticationError,
@@ -39,11 +51,21 @@ from src.bagelpay.exceptions import (
     BagelPayNotFoundError
 )
 
+# Choices for randomized product updates
+_UPDATE_BILLING = ("subscription", "subscription", "single_payment")
+_TAX = ("digital_products", "saas_services", "ebooks")
+_INTERVAL = ("daily", "weekly", "monthly", "3months", "6months")
+_TRIAL = (0, 1, 7)
+
 
+@functools.lru_cache(maxsize=4)
 def get_client(api_key: Optional[str] = None, base_url: Optional[str] = None) -> BagelPayClient:
     """
     Initialize and return a BagelPay client.
     
+    Clients are cached per (api_key, base_url), so repeated calls in the
+    same process reuse one client and its connection pool.
+    
     Args:
         api_key (Optional[str]): Your BagelPay API key. If not provided, will read from BAGELPAY_API_KEY environment variable.
         base_url (Optional[str]): Custom base URL for the API. If not provided, will use the default URL based on test_mode.
@@ -68,13 +90,10 @@ def get_client(api_key: Optional[str] = None, base_url: Optional[str] = None) ->
             "set BAGELPAY_API_KEY environment variable with: export BAGELPAY_API_KEY='your_api_key_here'"
         )
     
-    # Use test mode by default for examples
-    test_mode = os.getenv('BAGELPAY_TEST_MODE', 'true').lower() != 'false'
-    
     # Initialize the client
     client_kwargs = {
         'api_key': api_key,
-        'test_mode': test_mode,
+        'test_mode': _TEST_MODE,
         'timeout': 30  # 30 seconds timeout
     }
     
@@ -84,11 +103,28 @@ def get_client(api_key: Optional[str] = None, base_url: Optional[str] = None) ->
     
     client = BagelPayClient(**client_kwargs)
     
-    print(f"✅ BagelPay client initialized in {'Test' if test_mode else 'Live'} mode")
+    print(f"✅ BagelPay client initialized in {'Test' if _TEST_MODE else 'Live'} mode")
     return client
 
 
-def create_digital_product(client: BagelPayClient) -> str:
+def get_async_client(client: BagelPayClient) -> AsyncBagelPayClient:
+    """
+    Build an AsyncBagelPayClient with the same settings as a sync client.
+    
+    Args:
+        client (BagelPayClient): Client returned by get_client()
+    
+    Returns:
+        AsyncBagelPayClient: Async client for running independent calls concurrently
+    """
+    return AsyncBagelPayClient(
+        api_key=client.api_key,
+        base_url=client.base_url,
+        timeout=client.timeout
+    )
+
+
+async def create_digital_product(client: AsyncBagelPayClient) -> str:
     """Create a digital product example."""
     print("\n📦 Creating a digital product...")
     
@@ -105,7 +141,7 @@ def create_digital_product(client: BagelPayClient) -> str:
             trial_days=0
         )
         
-        product = client.create_product(product_request)
+        product = await client.create_product(product_request)
         
         print(f"✅ Digital product created successfully!")
         print(f"   Product ID: {product.product_id}")
@@ -127,7 +163,7 @@ def create_digital_product(client: BagelPayClient) -> str:
         raise
 
 
-def create_subscription_product(client: BagelPayClient) -> str:
+async def create_subscription_product(client: AsyncBagelPayClient) -> str:
     """Create a subscription product example."""
     print("\n🔄 Creating a subscription product...")
     
@@ -144,7 +180,7 @@ def create_subscription_product(client: BagelPayClient) -> str:
             trial_days=7
         )
         
-        product = client.create_product(product_request)
+        product = await client.create_product(product_request)
         
         print(f"✅ Subscription product created successfully!")
         print(f"   Product ID: {product.product_id}")
@@ -167,44 +203,56 @@ def create_subscription_product(client: BagelPayClient) -> str:
         raise
 
 
-def list_all_products(client: BagelPayClient) -> None:
-    """List all products with pagination."""
+async def list_all_products(client: AsyncBagelPayClient) -> None:
+    """
+    List all products with pagination.
+    
+    The first page is fetched on its own to learn the total; the remaining
+    pages are then requested concurrently and printed in page order.
+    """
     print("\n📋 Listing all products...")
     
     try:
-        page_num = 1
         page_size = 5
         total_products = 0
+        pages_listed = 0
         
-        while True:
-            response = client.list_products(pageNum=page_num, pageSize=page_size)
-            total_pages = int(response.total / page_size) + 1
-            
-            if page_num == 1:
-                print(f"📊 Total products found: {response.total}")
-                print(f"📄 Total pages: {total_pages}")
-            
+        response = await client.list_products(pageNum=1, pageSize=page_size)
+        total_pages = -(-response.total // page_size)
+        
+        print(f"📊 Total products found: {response.total}")
+        print(f"📄 Total pages: {total_pages}")
+        
+        pages = [response]
+        if response.items and total_pages > 1:
+            pages += await asyncio.gather(*[
+                client.list_products(pageNum=page_num, pageSize=page_size)
+                for page_num in range(2, total_pages + 1)
+            ])
+        
+        for page_num, response in enumerate(pages, start=1):
             if not response.items:
                 break
+            pages_listed += 1
             
-            print(f"\n--- Page {page_num} ---")
+            # Build the page in memory and write it out in one call
+            buf = io.StringIO()
+            buf.write(f"\n--- Page {page_num} ---\n")
             for product in response.items:
                 total_products += 1
-                print(f"  {total_products}. {product.name}")
-                print(f"     ID: {product.product_id}")
-                print(f"     Price: ${product.price} {product.currency}")
-                print(f"     Type: {product.billing_type}")
-                print(f"     Archived: {product.is_archive}")
-                print(f"     Recurring: {product.recurring_interval}")
-                print(f"     Created: {product.created_at}")
-                print()
-            
-            if page_num >= total_pages:
-                break
-            
-            page_num += 1
+                buf.write(
+                    f"  {total_products}. {product.name}\n"
+                    f"     ID: {product.product_id}\n"
+                    f"     Price: ${product.price} {product.currency}\n"
+                    f"     Type: {product.billing_type}\n"
+                    f"     Archived: {product.is_archive}\n"
+                    f"     Recurring: {product.recurring_interval}\n"
+                    f"     Created: {product.created_at}\n"
+                    f"\n"
+                )
+            sys.stdout.write(buf.getvalue())
         
-        print(f"✅ Listed {total_products} products across {page_num} pages")
+        print(f"✅ Listed {total_products} products across {pages_listed} pages")
         
     except BagelPayAPIError as e:
         print(f"❌ API error: {e.message}")
@@ -254,11 +302,11 @@ def update_product_details(client: BagelPayClient, product_id: str) -> None:
             description="New_Description_of_product_" + str(random.randint(1000, 9999)),
             price=random.uniform(50.5, 1024.5),
             currency="USD",
-            billing_type=random.choice(["subscription", "subscription", "single_payment"]),
+            billing_type=random.choice(_UPDATE_BILLING),
             tax_inclusive=False,
-            tax_category=random.choice(["digital_products", "saas_services", "ebooks"]),
-            recurring_interval=random.choice(["daily", "weekly", "monthly", "3months", "6months"]),
-            trial_days=random.choice([0, 1, 7])
+            tax_category=random.choice(_TAX),
+            recurring_interval=random.choice(_INTERVAL),
+            trial_days=random.choice(_TRIAL)
         )
         
         updated_product = client.update_product(update_request)
@@ -346,7 +394,7 @@ def demonstrate_error_handling(client: BagelPayClient) -> None:
         print(f"❌ Unexpected error: {str(e)}")
 
 
-def main():
+async def main():
     """Main function to run all product management examples."""
     print("🚀 BagelPay SDK - Product Management Examples")
     print("=" * 50)
@@ -355,12 +403,15 @@ def main():
         # Initialize client
         client = get_client()
         
-        # Create products
-        digital_product_id = create_digital_product(client)
-        subscription_product_id = create_subscription_product(client)
-        
-        # List all products
-        list_all_products(client)
+        async with get_async_client(client) as async_client:
+            # Create products (independent, so both requests run concurrently)
+            digital_product_id, subscription_product_id = await asyncio.gather(
+                create_digital_product(async_client),
+                create_subscription_product(async_client)
+            )
+            
+            # List all products
+            await list_all_products(async_client)
         
         # Get product details
         get_product_details(client, digital_product_id)
@@ -387,10 +438,11 @@ def main():
         print(f"\n❌ Unexpected error: {str(e)}")
         sys.exit(1)
     finally:
-        # Clean up
+        # Clean up, and drop the closed client so get_client() builds a fresh one
         if 'client' in locals():
             client.close()
+            get_client.cache_clear()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
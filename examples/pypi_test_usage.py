@@ -19,66 +19,21 @@ from datetime import datetime
 from typing import Optional
 
 try:
-    # Import from the installed PyPI package
+    # Import from the installed PyPI package; each test imports the rest of
+    # what it needs, so a missing name only fails that test
     from bagelpay.client import BagelPayClient
-    from bagelpay.models import (
-        Customer,
-        CheckoutRequest,
-        CreateProductRequest,
-        UpdateProductRequest,
-        ApiError,
-        Subscription,
-        SubscriptionListResponse,
-        CustomerListResponse
-    )
-    from bagelpay.exceptions import (
-        BagelPayError,
-        BagelPayAPIError,
-        BagelPayAuthenticationError,
-        BagelPayValidationError,
-        BagelPayNotFoundError
-    )
 except ImportError as e:
     print(f"Error importing BagelPay SDK from PyPI package: {e}")
     print("Please install the package first:")
     print("pip install -i https://test.pypi.org/simple/ bagelpay==1.0.1")
     sys.exit(1)
 
-
-def get_client(api_key: Optional[str] = None, base_url: Optional[str] = None) -> BagelPayClient:
-    """
-    Initialize and return a BagelPay client.
-    
-    Args:
-        api_key: Optional API key. If not provided, will try to get from environment.
-        base_url: Optional base URL. If not provided, will use default.
-    
-    Returns:
-        BagelPayClient: Initialized client instance
-    
-    Raises:
-        ValueError: If API key is not provided and not found in environment
-    """
-    if api_key is None:
-        api_key = os.getenv('BAGELPAY_API_KEY')
-        if not api_key:
-            raise ValueError(
-                "API key is required. Set BAGELPAY_API_KEY environment variable or pass api_key parameter."
-            )
-    
-    # Check if test mode is enabled (defaults to True for safety)
-    test_mode = os.getenv('BAGELPAY_TEST_MODE', 'true').lower() == 'true'
-    
-    client_config = {
-        'api_key': api_key,
-        'test_mode': test_mode
-    }
-    
-    if base_url:
-        client_config['base_url'] = base_url
-    
-    print(f"Initializing BagelPay client (test_mode: {test_mode})...")
-    return BagelPayClient(**client_config)
+# Choices for the randomized test product and checkout
+_BILLING_TYPES = ("subscription", "single_payment")
+_TAX = ("digital_products", "saas_services", "ebooks")
+_INTERVAL = ("daily", "weekly", "monthly", "3months", "6months")
+_TRIAL = (0, 1, 7)
+_SUCCESS_URLS = (None, "https://yourapp.com/success")
 
 
 def test_package_import():
@@ -88,7 +43,24 @@ def test_package_import():
     print("\n=== Testing Package Import ===")
     try:
         print("✓ Successfully imported BagelPayClient")
+        from bagelpay.models import (  # noqa: F401
+            Customer,
+            CheckoutRequest,
+            CreateProductRequest,
+            UpdateProductRequest,
+            ApiError,
+            Subscription,
+            SubscriptionListResponse,
+            CustomerListResponse
+        )
         print("✓ Successfully imported models")
+        from bagelpay.exceptions import (  # noqa: F401
+            BagelPayError,
+            BagelPayAPIError,
+            BagelPayAuthenticationError,
+            BagelPayValidationError,
+            BagelPayNotFoundError
+        )
         print("✓ Successfully imported exceptions")
         print("Package import test passed!")
         return True
@@ -119,6 +91,8 @@ def test_product_operations(client: BagelPayClient):
     Test basic product operations.
     """
     print("\n=== Testing Product Operations ===")
+    from bagelpay.models import CreateProductRequest
+    from bagelpay.exceptions import BagelPayAuthenticationError
     
     # Test product creation
     try:
@@ -127,11 +101,11 @@ def test_product_operations(client: BagelPayClient):
             description="A test product created using the PyPI package",
             price=29.99,
             currency="USD",
-            billing_type=random.choice(["subscription", "single_payment"]),
+            billing_type=random.choice(_BILLING_TYPES),
             tax_inclusive=False,
-            tax_category=random.choice(["digital_products", "saas_services", "ebooks"]),
-            recurring_interval=random.choice(["daily", "weekly", "monthly", "3months", "6months"]),
-            trial_days=random.choice([0, 1, 7])
+            tax_category=random.choice(_TAX),
+            recurring_interval=random.choice(_INTERVAL),
+            trial_days=random.choice(_TRIAL)
         )
         
         print("Attempting to create product...")
@@ -159,20 +133,23 @@ def test_checkout_operations(client: BagelPayClient, product_id: Optional[str] =
     Test checkout session creation.
     """
     print("\n=== Testing Checkout Operations ===")
+    from bagelpay.models import Customer, CheckoutRequest
+    from bagelpay.exceptions import BagelPayAuthenticationError
     
     if not product_id:
         product_id = "prod_1967229227842506754"
     
     try:
         customer = Customer(email="andrew@gettrust.com")
+        req_id = f"req_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         checkout_request = CheckoutRequest(
             product_id=product_id,
-            request_id=f"req_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            units=random.choice(["1", "2", "3", "4"]),
+            request_id=req_id,
+            units=str(random.randint(1, 4)),
             customer=customer,
-            success_url=random.choice([None, "https://yourapp.com/success"]),
+            success_url=random.choice(_SUCCESS_URLS),
             metadata={
-                "order_id": f"req_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                "order_id": req_id,
                 "campaign": "summer_sale",
                 "source": "website"
             }
@@ -203,6 +180,12 @@ def test_error_handling(client: BagelPayClient):
     Test error handling with the PyPI package.
     """
     print("\n=== Testing Error Handling ===")
+    from bagelpay.models import CreateProductRequest
+    from bagelpay.exceptions import (
+        BagelPayAuthenticationError,
+        BagelPayValidationError,
+        BagelPayNotFoundError
+    )
     
     try:
         # Test with invalid product ID
@@ -261,14 +244,18 @@ def run_comprehensive_test():
         print("\n❌ Client initialization failed. Exiting.")
         return False
     
-    # Test 3: Product Operations
-    product_id = test_product_operations(client)
-    
-    # Test 4: Checkout Operations
-    test_checkout_operations(client, product_id)
-    
-    # Test 5: Error Handling
-    test_error_handling(client)
+    try:
+        # Test 3: Product Operations
+        product_id = test_product_operations(client)
+        
+        # Test 4: Checkout Operations
+        test_checkout_operations(client, product_id)
+        
+        # Test 5: Error Handling
+        test_error_handling(client)
+    finally:
+        # Release the pooled connections
+        client.close()
     
     print("\n=== Test Summary ===")
     print("✓ Package import: PASSED")
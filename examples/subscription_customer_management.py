@@ -10,26 +10,38 @@ This example demonstrates subscription and customer management operations includ
 - Error handling for subscription and customer operations
 
 Before running this example:
-1. Install the SDK: pip install bagelpay
+1. Install the SDK: pip install bagelpay[async]
 2. Set your API key as an environment variable: export BAGELPAY_API_KEY="your_api_key_here"
 3. Optionally set test mode: export BAGELPAY_TEST_MODE="false" (defaults to true)
 """
 
 import os
 import sys
+import asyncio
+import io
+from collections import Counter, deque
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List, Callable, Awaitable, Any, AsyncIterator
 
-# Add the parent directory to the path to import the SDK
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Use the SDK from this checkout when there is one: the examples rely on APIs
+# newer than the published release
+_SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+if os.path.isdir(os.path.join(_SRC_DIR, 'bagelpay')):
+    sys.path.insert(0, _SRC_DIR)
 
-from src.bagelpay.client import BagelPayClient
-from src.bagelpay.models import (
+if __package__:
+    from ._common import get_client
+else:
+    from _common import get_client
+
+from bagelpay.client import BagelPayClient
+from bagelpay.async_client import AsyncBagelPayClient
+from bagelpay.models import (
     Subscription,
     SubscriptionListResponse,
     CustomerListResponse
 )
-from src.bagelpay.exceptions import (
+from bagelpay.exceptions import (
     BagelPayError,
     BagelPayAPIError,
     BagelPayAuthenticationError,
@@ -37,98 +49,155 @@ from src.bagelpay.exceptions import (
     BagelPayNotFoundError
 )
 
+# Listings fetch up to _PAGE_SIZE records per request (the API maximum) and
+# print them in groups of _DISPLAY_PAGE_SIZE
+_PAGE_SIZE = 100
+_DISPLAY_PAGE_SIZE = 5
+
 
-def get_client(api_key: Optional[str] = None, base_url: Optional[str] = None) -> BagelPayClient:
+def get_async_client(client: BagelPayClient) -> AsyncBagelPayClient:
     """
-    Initialize and return a BagelPay client.
+    Build an AsyncBagelPayClient with the same settings as a sync client.
     
-    Args:
-        api_key (Optional[str]): Your BagelPay API key. If not provided, will read from BAGELPAY_API_KEY environment variable.
-        base_url (Optional[str]): Custom base URL for the API. If not provided, will use the default URL based on test_mode.
+    Concurrent page fetches are capped at 8 requests in flight to stay well
+    within the API rate limits.
     
-    Environment variables:
-    - BAGELPAY_API_KEY: Your BagelPay API key (required if api_key parameter is not provided)
-    - BAGELPAY_TEST_MODE: Whether to use test mode (optional, defaults to true)
+    Args:
+        client (BagelPayClient): Client returned by get_client()
     
     Returns:
-        BagelPayClient: Initialized BagelPay client instance
+        AsyncBagelPayClient: Async client for running independent calls concurrently
+    """
+    return AsyncBagelPayClient(
+        api_key=client.api_key,
+        base_url=client.base_url,
+        timeout=client.timeout,
+        max_concurrency=8
+    )
+
+
+async def fetch_all_pages(
+    list_page: Callable[..., Awaitable[Any]],
+    page_size: int
+) -> List[Any]:
+    """
+    Fetch every page of a paginated listing.
     
-    Raises:
-        ValueError: If no API key is provided via parameter or environment variable
+    The first page is fetched on its own to learn the total; the remaining
+    pages are then requested concurrently.
+    
+    Args:
+        list_page: Async list method of AsyncBagelPayClient (e.g. list_subscriptions)
+        page_size (int): Items per page
+    
+    Returns:
+        List of page responses in page order
     """
-    # Get API key from parameter or environment variable
-    if api_key is None:
-        api_key = os.getenv('BAGELPAY_API_KEY')
+    first = await list_page(pageNum=1, pageSize=page_size)
+    total_pages = (first.total + page_size - 1) // page_size
     
-    if not api_key:
-        raise ValueError(
-            "API key is required. Either pass it as a parameter or "
-            "set BAGELPAY_API_KEY environment variable with: export BAGELPAY_API_KEY='your_api_key_here'"
-        )
+    if not first.items or total_pages <= 1:
+        return [first]
     
-    # Use test mode by default for examples
-    test_mode = os.getenv('BAGELPAY_TEST_MODE', 'true').lower() != 'false'
+    rest = await asyncio.gather(*[
+        list_page(pageNum=page_num, pageSize=page_size)
+        for page_num in range(2, total_pages + 1)
+    ])
+    return [first, *rest]
+
+
+async def iter_all_items(
+    list_page: Callable[..., Awaitable[Any]],
+    page_size: int,
+    pages_ahead: int = 8
+) -> AsyncIterator[Any]:
+    """
+    Yield every item of a paginated listing, one page at a time.
     
-    # Initialize the client
-    client_kwargs = {
-        'api_key': api_key,
-        'test_mode': test_mode,
-        'timeout': 30  # 30 seconds timeout
-    }
+    At most pages_ahead pages are requested ahead of the one being consumed;
+    a new request starts only as a page is handed out. Callers that reduce
+    the items on the fly therefore hold at most pages_ahead + 1 pages in
+    memory, however long the listing is.
     
-    # Add base_url if provided
-    if base_url is not None:
-        client_kwargs['base_url'] = base_url
+    Args:
+        list_page: Async list method of AsyncBagelPayClient (e.g. list_subscriptions)
+        page_size (int): Items per page
+        pages_ahead (int): Pages to prefetch concurrently (default: 8)
     
-    client = BagelPayClient(**client_kwargs)
+    Yields:
+        Items in listing order
+    """
+    first = await list_page(pageNum=1, pageSize=page_size)
+    total_pages = (first.total + page_size - 1) // page_size if first.items else 1
     
-    print(f"✅ BagelPay client initialized in {'Test' if test_mode else 'Live'} mode")
-    return client
+    pending = deque()
+    next_page = 2
+    try:
+        response = first
+        while True:
+            # Top up the prefetch window before handing out the current page
+            while next_page <= total_pages and len(pending) < pages_ahead:
+                pending.append(asyncio.ensure_future(
+                    list_page(pageNum=next_page, pageSize=page_size)
+                ))
+                next_page += 1
+            
+            for item in response.items:
+                yield item
+            
+            if not pending:
+                break
+            response = await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
 
 
-def list_all_subscriptions(client: BagelPayClient) -> Optional[str]:
-    """List all subscriptions with pagination."""
+async def list_all_subscriptions(
+    client: AsyncBagelPayClient,
+    cache_client: Optional[BagelPayClient] = None
+) -> Optional[str]:
+    """
+    List all subscriptions with pagination.
+    
+    If cache_client is given, the listed subscriptions are stored in its
+    cache so later get_subscription calls on it need no request.
+    """
     print("\n🔄 Listing all subscriptions...")
     
     try:
-        page_num = 1
-        page_size = 5
         total_subscriptions = 0
         first_subscription_id = None
         
-        while True:
-            response = client.list_subscriptions(pageNum=page_num, pageSize=page_size)
-            
-            if page_num == 1:
-                print(f"📊 Total subscriptions found: {response.total}")
-                # Calculate pages from total and page_size
-                total_pages = (response.total + page_size - 1) // page_size
-                print(f"📄 Total pages: {total_pages}")
-            
-            if not response.items:
-                break
-            
-            print(f"\n--- Page {page_num} ---")
-            for subscription in response.items:
+        pages = await fetch_all_pages(client.list_subscriptions, _PAGE_SIZE)
+        subscriptions = [item for response in pages for item in response.items]
+        if cache_client is not None:
+            cache_client.prime_subscription_cache(subscriptions)
+        
+        print(f"📊 Total subscriptions found: {pages[0].total}")
+        # Calculate display pages from total and _DISPLAY_PAGE_SIZE
+        total_pages = (pages[0].total + _DISPLAY_PAGE_SIZE - 1) // _DISPLAY_PAGE_SIZE
+        print(f"📄 Total pages: {total_pages}")
+        
+        for page_num, start in enumerate(range(0, len(subscriptions), _DISPLAY_PAGE_SIZE), start=1):
+            # Build the page in memory and write it out in one call
+            buf = io.StringIO()
+            buf.write(f"\n--- Page {page_num} ---\n")
+            for subscription in subscriptions[start:start + _DISPLAY_PAGE_SIZE]:
                 total_subscriptions += 1
                 if first_subscription_id is None:
                     first_subscription_id = subscription.subscription_id
                 
-                print(f"  {total_subscriptions}. Subscription ID: {subscription.subscription_id}")
-                print(f"     Customer: {subscription.customer.email if subscription.customer else 'N/A'}")
-                print(f"     Status: {subscription.status}")
-                print(f"     Product: {subscription.product_name or 'N/A'}")
-                print(f"     Created: {subscription.created_at}")
-                if hasattr(subscription, 'current_period_start'):
-                    print(f"     Current Period: {subscription.current_period_start} - {getattr(subscription, 'current_period_end', 'N/A')}")
-                print()
-            
-            # Calculate if we've reached the last page
-            total_pages = (response.total + page_size - 1) // page_size
-            if page_num >= total_pages:
-                break
-            
-            page_num += 1
+                buf.write(
+                    f"  {total_subscriptions}. Subscription ID: {subscription.subscription_id}\n"
+                    f"     Customer: {subscription.customer.email if subscription.customer else 'N/A'}\n"
+                    f"     Status: {subscription.status}\n"
+                    f"     Product: {subscription.product_name or 'N/A'}\n"
+                    f"     Created: {subscription.created_at}\n"
+                    f"     Current Period: {subscription.billing_period_start or 'N/A'} - {subscription.billing_period_end or 'N/A'}\n"
+                    f"\n"
+                )
+            sys.stdout.write(buf.getvalue())
         
         if total_subscriptions == 0:
             print("📭 No subscriptions found.")
@@ -153,22 +222,20 @@ def get_subscription_details(client: BagelPayClient, subscription_id: str) -> No
     try:
         subscription = client.get_subscription(subscription_id)
         
-        print(f"✅ Subscription details retrieved successfully!")
-        print(f"   ID: {subscription.subscription_id}")
-        print(f"   Status: {subscription.status}")
-        print(f"   Customer: {subscription.customer.email if subscription.customer else 'N/A'}")
-        print(f"   Product: {subscription.product_name or 'N/A'}")
-        print(f"   Created: {subscription.created_at}")
-        print(f"   Updated: {getattr(subscription, 'updated_at', 'N/A')}")
-        
-        if hasattr(subscription, 'billing_period_start'):
-            print(f"   Billing Period Start: {subscription.billing_period_start}")
-        if hasattr(subscription, 'billing_period_end'):
-            print(f"   Billing Period End: {subscription.billing_period_end}")
-        if hasattr(subscription, 'trial_end'):
-            print(f"   Trial End: {subscription.trial_end}")
-        if hasattr(subscription, 'cancel_at_period_end'):
-            print(f"   Cancel at Period End: {subscription.cancel_at}")
+        customer = subscription.customer
+        print(
+            f"✅ Subscription details retrieved successfully!\n"
+            f"   ID: {subscription.subscription_id}\n"
+            f"   Status: {subscription.status}\n"
+            f"   Customer: {customer.email if customer else 'N/A'}\n"
+            f"   Product: {subscription.product_name or 'N/A'}\n"
+            f"   Created: {subscription.created_at}\n"
+            f"   Updated: {subscription.updated_at or 'N/A'}\n"
+            f"   Billing Period Start: {subscription.billing_period_start or 'N/A'}\n"
+            f"   Billing Period End: {subscription.billing_period_end or 'N/A'}\n"
+            f"   Trial End: {subscription.trial_end or 'N/A'}\n"
+            f"   Cancel At: {subscription.cancel_at or 'N/A'}"
+        )
         
     except BagelPayNotFoundError as e:
         print(f"❌ Subscription not found: {e.message}")
@@ -197,10 +264,8 @@ def cancel_subscription_example(client: BagelPayClient, subscription_id: str) ->
         print(f"✅ Subscription canceled successfully!")
         print(f"   ID: {canceled_subscription.subscription_id}")
         print(f"   Status after: {canceled_subscription.status}")
-        print(f"   Updated: {getattr(canceled_subscription, 'updated_at', 'N/A')}")
-        
-        if hasattr(canceled_subscription, 'canceled_at'):
-            print(f"   Canceled at: {canceled_subscription.cancel_at}")
+        print(f"   Updated: {canceled_subscription.updated_at or 'N/A'}")
+        print(f"   Canceled at: {canceled_subscription.cancel_at or 'N/A'}")
         
     except BagelPayNotFoundError as e:
         print(f"❌ Subscription not found: {e.message}")
@@ -213,45 +278,35 @@ def cancel_subscription_example(client: BagelPayClient, subscription_id: str) ->
         print(f"❌ Unexpected error: {str(e)}")
 
 
-def list_all_customers(client: BagelPayClient) -> None:
+async def list_all_customers(client: AsyncBagelPayClient) -> None:
     """List all customers with pagination."""
     print("\n👥 Listing all customers...")
     
     try:
-        page_num = 1
-        page_size = 5
         total_customers = 0
         
-        while True:
-            response = client.list_customers(pageNum=page_num, pageSize=page_size)
-            
-            if page_num == 1:
-                print(f"📊 Total customers found: {response.total}")
-                total_pages = (response.total + page_size - 1) // page_size
-                print(f"📄 Total pages: {total_pages}")
-            
-            if not response.items:
-                break
-            
-            print(f"\n--- Page {page_num} ---")
-            for customer in response.items:
+        pages = await fetch_all_pages(client.list_customers, _PAGE_SIZE)
+        customers = [item for response in pages for item in response.items]
+        
+        print(f"📊 Total customers found: {pages[0].total}")
+        total_pages = (pages[0].total + _DISPLAY_PAGE_SIZE - 1) // _DISPLAY_PAGE_SIZE
+        print(f"📄 Total pages: {total_pages}")
+        
+        for page_num, start in enumerate(range(0, len(customers), _DISPLAY_PAGE_SIZE), start=1):
+            buf = io.StringIO()
+            buf.write(f"\n--- Page {page_num} ---\n")
+            for customer in customers[start:start + _DISPLAY_PAGE_SIZE]:
                 total_customers += 1
-                print(f"  {total_customers}. Customer ID: {customer.id}")
-                print(f"     Name: {getattr(customer, 'name', 'N/A')}")
-                print(f"     Email: {customer.email}")
-                print(f"     Phone: {getattr(customer, 'phone', 'N/A')}")
-                print(f"     Created: {customer.created_at}")
-                if hasattr(customer, 'total_spent'):
-                    print(f"     Total Spent: ${customer.total_spend}")
-                if hasattr(customer, 'subscription_count'):
-                    print(f"     Subscriptions: {customer.subscriptions}")
-                print()
-            
-            total_pages = (response.total + page_size - 1) // page_size
-            if page_num >= total_pages:
-                break
-            
-            page_num += 1
+                buf.write(
+                    f"  {total_customers}. Customer ID: {customer.id}\n"
+                    f"     Name: {customer.name or 'N/A'}\n"
+                    f"     Email: {customer.email}\n"
+                    f"     Created: {customer.created_at}\n"
+                    f"     Total Spent: ${(customer.total_spend or 0) / 100:.2f}\n"
+                    f"     Subscriptions: {customer.subscriptions or 0}\n"
+                    f"\n"
+                )
+            sys.stdout.write(buf.getvalue())
         
         if total_customers == 0:
             print("📭 No customers found.")
@@ -267,47 +322,30 @@ def list_all_customers(client: BagelPayClient) -> None:
         raise
 
 
-def analyze_subscription_metrics(client: BagelPayClient) -> None:
+async def analyze_subscription_metrics(client: AsyncBagelPayClient) -> None:
     """Analyze subscription metrics and provide insights."""
     print("\n📈 Analyzing subscription metrics...")
     
     try:
-        # Get all subscriptions for analysis
-        all_subscriptions = []
-        page_num = 1
-        page_size = 50  # Larger page size for analysis
-        
-        while True:
-            response = client.list_subscriptions(pageNum=page_num, pageSize=page_size)
-            
-            if not response.items:
-                break
-            
-            all_subscriptions.extend(response.items)
-            
-            total_pages = (response.total + page_size - 1) // page_size
-            if page_num >= total_pages:
-                break
-            
-            page_num += 1
+        # Analyze subscription statuses as the pages stream in
+        status_counts = Counter()
+        async for subscription in iter_all_items(client.list_subscriptions, _PAGE_SIZE):
+            status_counts[subscription.status] += 1
         
-        if not all_subscriptions:
+        total_subscriptions = sum(status_counts.values())
+        if not total_subscriptions:
             print("📭 No subscriptions available for analysis.")
             return
         
-        # Analyze subscription statuses
-        status_counts = {}
-        
-        for subscription in all_subscriptions:
-            status = subscription.status
-            status_counts[status] = status_counts.get(status, 0) + 1
+        # Format each status label and the percentage scale once
+        labels = {status: status.title() for status in status_counts}
+        scale = 100 / total_subscriptions
         
         print(f"📊 Subscription Analysis:")
-        print(f"   Total Subscriptions: {len(all_subscriptions)}")
+        print(f"   Total Subscriptions: {total_subscriptions}")
         print(f"   Status Breakdown:")
         for status, count in status_counts.items():
-            percentage = (count / len(all_subscriptions)) * 100
-            print(f"     {status.title()}: {count} ({percentage:.1f}%)")
+            print(f"     {labels[status]}: {count} ({count * scale:.1f}%)")
         
     except Exception as e:
         print(f"❌ Analysis failed: {str(e)}")
@@ -337,7 +375,7 @@ def demonstrate_error_handling(client: BagelPayClient) -> None:
     except Exception as e:
         print(f"❌ Unexpected error: {str(e)}")
     
-    # Try to list with invalid pagination parameters
+    # Try to list with invalid pagination parameters (rejected locally, nothing is sent)
     print("\n3. Trying to list subscriptions with invalid page size...")
     try:
         client.list_subscriptions(pageNum=1, pageSize=0)  # Invalid page size
@@ -349,17 +387,27 @@ def demonstrate_error_handling(client: BagelPayClient) -> None:
         print(f"❌ Unexpected error: {str(e)}")
 
 
-def main():
+async def main():
     """Main function to run all subscription and customer management examples."""
     print("🚀 BagelPay SDK - Subscription and Customer Management Examples")
     print("=" * 70)
     
     try:
         # Initialize client
-        client = get_client()
+        client = get_client(
+            http2=True,  # Multiplex over HTTP/2 when httpx[http2] is installed
+            cache_ttl=30  # Reuse read results (e.g. get_subscription) for 30 seconds
+        )
         
-        # List all subscriptions
-        first_subscription_id = list_all_subscriptions(client)
+        async_client = get_async_client(client)
+        
+        # List subscriptions and customers and analyze the metrics concurrently;
+        # each step prints its results in one block once its pages have arrived
+        first_subscription_id, _, _ = await asyncio.gather(
+            list_all_subscriptions(async_client, client),
+            list_all_customers(async_client),
+            analyze_subscription_metrics(async_client)
+        )
         
         # Get subscription details if we have any subscriptions
         if first_subscription_id:
@@ -372,12 +420,6 @@ def main():
             print(f"   To cancel subscription {first_subscription_id}, you would call:")
             print(f"   client.cancel_subscription('{first_subscription_id}')")
         
-        # List all customers
-        list_all_customers(client)
-        
-        # Analyze subscription metrics
-        analyze_subscription_metrics(client)
-        
         # Demonstrate error handling
         demonstrate_error_handling(client)
         
@@ -400,9 +442,12 @@ def main():
         sys.exit(1)
     finally:
         # Clean up
+        if 'async_client' in locals():
+            await async_client.aclose()
         if 'client' in locals():
             client.close()
+            get_client.cache_clear()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
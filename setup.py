@@ -64,6 +64,12 @@ setup(
         "requests>=2.25.0",
     ],
     extras_require={
+        "async": [
+            "httpx[http2]>=0.23.0",
+        ],
+        "speedups": [
+            "orjson>=3.6.0",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
@@ -38,6 +38,7 @@ __email__ = "support@bagelpayment.com"
 
 # Import main classes and exceptions
 from .client import BagelPayClient
+from .async_client import AsyncBagelPayClient
 from .models import (
     CheckoutRequest,
     CheckoutResponse,
@@ -69,6 +70,7 @@ from .exceptions import (
 __all__ = [
     # Client
     "BagelPayClient",
+    "AsyncBagelPayClient",
     
     # Models
     "CheckoutRequest",
@@ -0,0 +1,393 @@
+"""BagelPay Async API Client"""
+
+import asyncio
+from types import TracebackType
+from typing import Optional, Dict, Any, Type
+from urllib.parse import urljoin
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+from .client import _check_pagination, _parse_response, _HTTP2_AVAILABLE
+from .models import (
+    CheckoutRequest,
+    CheckoutResponse,
+    CreateProductRequest,
+    Product,
+    ProductListResponse,
+    UpdateProductRequest,
+    TransactionListResponse,
+    Subscription,
+    SubscriptionListResponse,
+    CustomerListResponse
+)
+from .exceptions import BagelPayError
+
+
+class AsyncBagelPayClient:
+    """Asynchronous BagelPay API Client
+    
+    Mirrors :class:`BagelPayClient` with ``async`` methods so independent
+    calls can be awaited concurrently (e.g. with ``asyncio.gather``).
+    Requires the optional ``httpx`` dependency: ``pip install bagelpay[async]``.
+    
+    Args:
+        api_key: API key for authentication
+        test_mode: Whether to use test mode (default: True)
+        base_url: Optional custom base URL (overrides test_mode)
+        timeout: Request timeout in seconds (default: 30)
+        max_concurrency: Maximum number of requests in flight at once; extra
+            calls wait for a free slot (default: 16)
+        max_connections: Maximum number of open connections (default: 16)
+        max_keepalive_connections: Idle connections kept for reuse (default: 16)
+        http2: Whether to negotiate HTTP/2 when the ``h2`` package is
+            installed (default: True)
+    """
+    
+    def __init__(
+        self,
+        api_key: str,
+        test_mode: bool = True,
+        base_url: Optional[str] = None,
+        timeout: float = 30.0,
+        max_concurrency: int = 16,
+        max_connections: int = 16,
+        max_keepalive_connections: int = 16,
+        http2: bool = True
+    ):
+        if httpx is None:
+            raise BagelPayError(
+                "AsyncBagelPayClient requires httpx. "
+                "Install it with: pip install bagelpay[async]"
+            )
+        
+        # Determine base URL based on test mode
+        if base_url:
+            self.base_url = base_url.rstrip('/')
+        else:
+            self.base_url = 'https://test.bagelpay.io' if test_mode else 'https://live.bagelpay.io'
+        
+        self.api_key = api_key
+        self.test_mode = test_mode
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        # Created on first use so it binds to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.session = httpx.AsyncClient(
+            headers={
+                'Content-Type': 'application/json',
+                'User-Agent': 'BagelPay-Python-SDK/1.0.0',
+                'Connection': 'keep-alive',
+                'x-api-key': api_key
+            },
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections
+            ),
+            http2=http2 and _HTTP2_AVAILABLE,
+            timeout=timeout
+        )
+    
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Make HTTP request to the API
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            data: Request body data
+            params: Query parameters
+        
+        Returns:
+            Response data as dictionary
+        
+        Raises:
+            BagelPayAPIError: If API returns an error
+            BagelPayError: If request fails
+        """
+        url = urljoin(self.base_url, endpoint)
+        
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        try:
+            async with self._semaphore:
+                response = await self.session.request(
+                    method=method,
+                    url=url,
+                    json=data,
+                    params=params
+                )
+        except httpx.HTTPError as e:
+            raise BagelPayError(f"Request failed: {str(e)}")
+        
+        return _parse_response(response)
+    
+    async def create_checkout(self, checkout_request: CheckoutRequest) -> CheckoutResponse:
+        """Create a new checkout session
+        
+        Args:
+            checkout_request: Checkout request data
+        
+        Returns:
+            Checkout response with session details
+        """
+        data = await self._make_request(
+            method='POST',
+            endpoint='/api/payments/checkouts',
+            data=checkout_request.to_dict()
+        )
+        return CheckoutResponse.from_dict(data)
+    
+    async def create_product(self, product_request: CreateProductRequest) -> Product:
+        """Create a new product
+        
+        Args:
+            product_request: Product creation data
+        
+        Returns:
+            Created product details
+        """
+        data = await self._make_request(
+            method='POST',
+            endpoint='/api/products/create',
+            data=product_request.to_dict()
+        )
+        return Product.from_dict(data)
+    
+    async def list_products(
+        self,
+        pageNum: int = 1,
+        pageSize: int = 10
+    ) -> ProductListResponse:
+        """List products with pagination
+        
+        Args:
+            pageNum: Page number (default: 1)
+            pageSize: Items per page (default: 10)
+        
+        Returns:
+            Paginated list of products
+        """
+        _check_pagination(pageNum, pageSize)
+        params = {
+            'pageNum': pageNum,
+            'pageSize': pageSize
+        }
+        
+        data = await self._make_request(
+            method='GET',
+            endpoint='/api/products/list',
+            params=params
+        )
+        return ProductListResponse.from_dict(data)
+    
+    async def get_product(self, product_id: str) -> Product:
+        """Get product details by ID
+        
+        Args:
+            product_id: Product ID
+        
+        Returns:
+            Product details
+        """
+        data = await self._make_request(
+            method='GET',
+            endpoint=f'/api/products/{product_id}'
+        )
+        return Product.from_dict(data)
+    
+    async def archive_product(self, product_id: str) -> Product:
+        """Archive a product
+        
+        Args:
+            product_id: Product ID to archive
+        
+        Returns:
+            Updated product details
+        """
+        data = await self._make_request(
+            method='POST',
+            endpoint=f'/api/products/{product_id}/archive'
+        )
+        return Product.from_dict(data)
+    
+    async def unarchive_product(self, product_id: str) -> Product:
+        """Unarchive a product
+        
+        Args:
+            product_id: Product ID to unarchive
+        
+        Returns:
+            Updated product details
+        """
+        data = await self._make_request(
+            method='POST',
+            endpoint=f'/api/products/{product_id}/unarchive'
+        )
+        return Product.from_dict(data)
+    
+    async def set_product_archived(self, product_id: str, archived: bool) -> Product:
+        """Archive or unarchive a product
+        
+        Args:
+            product_id: Product ID
+            archived: True to archive the product, False to unarchive it
+            
+        Returns:
+            Updated product details
+        """
+        if archived:
+            return await self.archive_product(product_id)
+        return await self.unarchive_product(product_id)
+    
+    async def update_product(self, request: UpdateProductRequest) -> Product:
+        """Update a product
+        
+        Args:
+            request: Product update request data
+        
+        Returns:
+            Updated product details
+        """
+        data = await self._make_request(
+            method='POST',
+            endpoint='/api/products/update',
+            data=request.to_dict()
+        )
+        return Product.from_dict(data)
+    
+    async def list_transactions(
+        self,
+        pageNum: int = 1,
+        pageSize: int = 10
+    ) -> TransactionListResponse:
+        """List transactions with pagination
+        
+        Args:
+            pageNum: Page number (default: 1)
+            pageSize: Items per page (default: 10)
+        
+        Returns:
+            Paginated list of transactions
+        """
+        _check_pagination(pageNum, pageSize)
+        params = {
+            'pageNum': pageNum,
+            'pageSize': pageSize
+        }
+        
+        data = await self._make_request(
+            method='GET',
+            endpoint='/api/transactions/list',
+            params=params
+        )
+        return TransactionListResponse.from_dict(data)
+    
+    async def list_subscriptions(
+        self,
+        pageNum: int = 1,
+        pageSize: int = 10
+    ) -> SubscriptionListResponse:
+        """List subscriptions with pagination
+        
+        Args:
+            pageNum: Page number (default: 1)
+            pageSize: Items per page (default: 10)
+        
+        Returns:
+            Paginated list of subscriptions
+        """
+        _check_pagination(pageNum, pageSize)
+        params = {
+            'pageNum': pageNum,
+            'pageSize': pageSize
+        }
+        
+        data = await self._make_request(
+            method='GET',
+            endpoint='/api/subscriptions/list',
+            params=params
+        )
+        return SubscriptionListResponse.from_dict(data)
+    
+    async def get_subscription(self, subscription_id: str) -> Subscription:
+        """Get subscription details by ID
+        
+        Args:
+            subscription_id: Subscription ID
+        
+        Returns:
+            Subscription details
+        """
+        data = await self._make_request(
+            method='GET',
+            endpoint=f'/api/subscriptions/{subscription_id}'
+        )
+        return Subscription.from_dict(data)
+    
+    async def cancel_subscription(self, subscription_id: str) -> Subscription:
+        """Cancel a subscription
+        
+        Args:
+            subscription_id: Subscription ID to cancel
+        
+        Returns:
+            Updated subscription details
+        """
+        data = await self._make_request(
+            method='POST',
+            endpoint=f'/api/subscriptions/{subscription_id}/cancel'
+        )
+        return Subscription.from_dict(data)
+    
+    async def list_customers(
+        self,
+        pageNum: int = 1,
+        pageSize: int = 10
+    ) -> CustomerListResponse:
+        """List customers with pagination
+        
+        Args:
+            pageNum: Page number (default: 1)
+            pageSize: Items per page (default: 10)
+        
+        Returns:
+            Paginated list of customers
+        """
+        _check_pagination(pageNum, pageSize)
+        params = {
+            'pageNum': pageNum,
+            'pageSize': pageSize
+        }
+        
+        data = await self._make_request(
+            method='GET',
+            endpoint='/api/customers/list',
+            params=params
+        )
+        return CustomerListResponse.from_dict(data)
+    
+    async def aclose(self) -> None:
+        """Close the HTTP session"""
+        await self.session.aclose()
+    
+    async def __aenter__(self) -> 'AsyncBagelPayClient':
+        """Async context manager entry"""
+        return self
+    
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType]
+    ) -> None:
+        """Async context manager exit"""
+        await self.aclose()
@@ -1,8 +1,12 @@
 """BagelPay API Client"""
 
+import time
+import importlib.util
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Any, Tuple, Type, Iterator, Iterable, Callable, TypeVar
 from urllib.parse import urljoin
+from urllib3.util.retry import Retry
 
 from .models import (
     CheckoutRequest,
@@ -11,13 +15,100 @@ from .models import (
     Product,
     ProductListResponse,
     UpdateProductRequest,
+    Transaction,
     TransactionListResponse,
     Subscription,
     SubscriptionListResponse,
+    CustomerData,
     CustomerListResponse,
     ApiError
 )
-from .exceptions import BagelPayError, BagelPayAPIError
+from .exceptions import BagelPayError, BagelPayAPIError, BagelPayValidationError
+
+_loads: Callable[[bytes], Any]
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency
+    import json
+    _loads = json.loads
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+_HTTP2_AVAILABLE = httpx is not None and importlib.util.find_spec("h2") is not None
+
+# Exceptions raised by either transport when a request cannot complete
+_TRANSPORT_ERRORS: Tuple[Type[BaseException], ...] = (requests.exceptions.RequestException,) + (
+    (httpx.HTTPError,) if httpx is not None else ()
+)
+
+T = TypeVar('T')
+
+
+def _check_pagination(page_num: int, page_size: int) -> None:
+    """Reject page arguments the API would refuse, without a round trip
+    
+    Raises:
+        BagelPayValidationError: If page_num or page_size is below 1
+    """
+    if page_num < 1:
+        raise BagelPayValidationError(f"pageNum must be at least 1, got {page_num}")
+    if page_size < 1:
+        raise BagelPayValidationError(f"pageSize must be at least 1, got {page_size}")
+
+
+def _parse_response(response: Any) -> Dict[str, Any]:
+    """Turn an HTTP response into API data or raise the matching error
+    
+    Shared by the sync and async clients; ``response`` only needs the
+    ``status_code``, ``content`` and ``text`` members common to
+    ``requests`` and ``httpx`` responses. Bodies are decoded with orjson
+    when it is installed, falling back to the standard json module.
+    
+    Raises:
+        BagelPayAPIError: If API returns an error
+        BagelPayError: If the response body is not valid JSON
+    """
+    # Check if request was successful
+    if response.status_code >= 400:
+        try:
+            error_data = _loads(response.content)
+        except ValueError:
+            # Response is not JSON
+            raise BagelPayAPIError(
+                message=f"HTTP {response.status_code}: {response.text}",
+                status_code=response.status_code
+            )
+        error = ApiError.from_dict(error_data)
+        raise BagelPayAPIError(
+            message=error.message,
+            error_code=error.code,
+            status_code=response.status_code,
+            api_error=error
+        )
+    
+    try:
+        data: Dict[str, Any] = _loads(response.content)
+    except ValueError:
+        # Response is not JSON
+        raise BagelPayError(f"Invalid JSON response: {response.text}")
+    
+    # Check if the response contains an error even with 200 status
+    if isinstance(data, dict) and 'msg' in data and 'code' in data:
+        # This looks like an error response
+        if data.get('code') in [401, 403, 404, 400, 422, 500]:
+            error = ApiError.from_dict(data)
+            raise BagelPayAPIError(
+                message=error.message,
+                error_code=error.code,
+                status_code=data.get('code', response.status_code),
+                api_error=error
+            )
+    
+    return data
 
 
 class BagelPayClient:
@@ -30,6 +121,21 @@ class BagelPayClient:
         test_mode: Whether to use test mode (default: True)
         base_url: Optional custom base URL (overrides test_mode)
         timeout: Request timeout in seconds (default: 30)
+        pool_connections: Number of host connection pools to cache (default: 10)
+        pool_maxsize: Maximum connections kept alive per pool (default: 20)
+        max_retries: Retries for idempotent requests that fail to connect or
+            return 502/503/504 (default: 3)
+        cache_ttl: Seconds to keep results of read-only calls (get_product,
+            list_products, get_subscription, list_subscriptions,
+            list_customers) in memory; 0 disables caching (default: 0)
+        http2: Send requests over an HTTP/2 ``httpx.Client`` so calls share
+            one multiplexed connection. Requires ``pip install bagelpay[async]``;
+            falls back to the default requests transport when httpx or h2
+            is not installed. On this transport max_retries only covers
+            failed connection attempts; 502/503/504 responses are not
+            retried. ``session`` remains a ``requests.Session``, but header
+            changes made on it after construction do not reach the HTTP/2
+            client (default: False)
     """
     
     def __init__(
@@ -37,7 +143,12 @@ class BagelPayClient:
         api_key: str,
         test_mode: bool = True,
         base_url: Optional[str] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        pool_connections: int = 10,
+        pool_maxsize: int = 20,
+        max_retries: int = 3,
+        cache_ttl: float = 0,
+        http2: bool = False
     ):
         # Determine base URL based on test mode
         if base_url:
@@ -48,16 +159,51 @@ class BagelPayClient:
         self.api_key = api_key
         self.test_mode = test_mode
         self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+        self.http2 = http2 and _HTTP2_AVAILABLE
         self.session = requests.Session()
         
+        # Reuse keep-alive connections across calls instead of paying a
+        # TCP+TLS handshake per request
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=max_retries,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # Set default headers
         self.session.headers.update({
             'Content-Type': 'application/json',
-            'User-Agent': 'BagelPay-Python-SDK/1.0.0'
+            'User-Agent': 'BagelPay-Python-SDK/1.0.0',
+            'Connection': 'keep-alive'
         })
         
         # Set authorization header
         self.session.headers['x-api-key'] = api_key
+        
+        # With http2, requests go through a separate httpx client that
+        # starts with a copy of the session headers
+        self._http2_client: Optional['httpx.Client'] = None
+        if self.http2:
+            self._http2_client = httpx.Client(
+                headers=dict(self.session.headers),
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=pool_maxsize,
+                        max_keepalive_connections=pool_maxsize
+                    ),
+                    retries=max_retries
+                )
+            )
     
     def _make_request(
         self,
@@ -83,55 +229,102 @@ class BagelPayClient:
         """
         url = urljoin(self.base_url, endpoint)
         
+        response: Any
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                json=data,
-                params=params,
-                timeout=self.timeout
-            )
+            if self._http2_client is not None:
+                response = self._http2_client.request(
+                    method=method,
+                    url=url,
+                    json=data,
+                    params=params,
+                    timeout=self.timeout
+                )
+            else:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    json=data,
+                    params=params,
+                    timeout=self.timeout
+                )
+        except _TRANSPORT_ERRORS as e:
+            raise BagelPayError(f"Request failed: {str(e)}")
+        except RuntimeError as e:
+            # httpx raises RuntimeError when the client has already been closed
+            if self._http2_client is None:
+                raise
+            raise BagelPayError(f"Request failed: {str(e)}")
+        
+        return _parse_response(response)
+    
+    def _cache_get(self, key: Tuple[Any, ...]) -> Any:
+        """Return a cached result, or None if missing, expired or disabled"""
+        if self.cache_ttl <= 0:
+            return None
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[key]
+            return None
+        return value
+    
+    def _cache_set(self, key: Tuple[Any, ...], value: Any) -> None:
+        """Store a result for cache_ttl seconds"""
+        if self.cache_ttl > 0:
+            self._cache[key] = (time.monotonic() + self.cache_ttl, value)
+    
+    def _cache_drop(self, *methods: str) -> None:
+        """Drop cached results of the given read methods"""
+        for key in [key for key in self._cache if key[0] in methods]:
+            del self._cache[key]
+    
+    def clear_cache(self) -> None:
+        """Drop all cached read results"""
+        self._cache.clear()
+    
+    def _iter_items(
+        self,
+        endpoint: str,
+        item_from_dict: Callable[[Dict[str, Any]], T],
+        page_size: int
+    ) -> Iterator[T]:
+        """Yield items of a paginated list endpoint one at a time
+        
+        Pages are requested lazily and each item is only turned into a
+        model when it is consumed, so stopping early skips both the
+        remaining pages and the parsing of unread items.
+        
+        Args:
+            endpoint: API endpoint path of the list call
+            item_from_dict: Model constructor for a single item
+            page_size: Items requested per page
             
-            # Check if request was successful
-            if response.status_code >= 400:
-                try:
-                    error_data = response.json()
-                    error = ApiError.from_dict(error_data)
-                    raise BagelPayAPIError(
-                        message=error.message,
-                        error_code=error.code,
-                        status_code=response.status_code,
-                        api_error=error
-                    )
-                except ValueError:
-                    # Response is not JSON
-                    raise BagelPayAPIError(
-                        message=f"HTTP {response.status_code}: {response.text}",
-                        status_code=response.status_code
-                    )
+        Yields:
+            Parsed model instances
             
-            try:
-                data = response.json()
-                
-                # Check if the response contains an error even with 200 status
-                if isinstance(data, dict) and 'msg' in data and 'code' in data:
-                    # This looks like an error response
-                    if data.get('code') in [401, 403, 404, 400, 422, 500]:
-                        error = ApiError.from_dict(data)
-                        raise BagelPayAPIError(
-                            message=error.message,
-                            error_code=error.code,
-                            status_code=data.get('code', response.status_code),
-                            api_error=error
-                        )
-                
-                return data
-            except ValueError:
-                # Response is not JSON
-                raise BagelPayError(f"Invalid JSON response: {response.text}")
+        Raises:
+            BagelPayValidationError: If page_size is below 1
+        """
+        _check_pagination(1, page_size)
+        page_num = 1
+        while True:
+            data = self._make_request(
+                method='GET',
+                endpoint=endpoint,
+                params={
+                    'pageNum': page_num,
+                    'pageSize': page_size
+                }
+            )
+            items = data["items"]
+            for item in items:
+                yield item_from_dict(item)
             
-        except requests.exceptions.RequestException as e:
-            raise BagelPayError(f"Request failed: {str(e)}")
+            if not items or page_num * page_size >= data["total"]:
+                return
+            page_num += 1
     
     def create_checkout(self, checkout_request: CheckoutRequest) -> CheckoutResponse:
         """Create a new checkout session
@@ -163,6 +356,7 @@ class BagelPayClient:
             endpoint='/api/products/create',
             data=product_request.to_dict()
         )
+        self.clear_cache()
         return Product.from_dict(data)
     
     def list_products(
@@ -179,6 +373,12 @@ class BagelPayClient:
         Returns:
             Paginated list of products
         """
+        _check_pagination(pageNum, pageSize)
+        cache_key = ('list_products', pageNum, pageSize)
+        cached: Optional[ProductListResponse] = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
         params = {
             'pageNum': pageNum,
             'pageSize': pageSize
@@ -189,7 +389,20 @@ class BagelPayClient:
             endpoint='/api/products/list',
             params=params
         )
-        return ProductListResponse.from_dict(data)
+        result = ProductListResponse.from_dict(data)
+        self._cache_set(cache_key, result)
+        return result
+    
+    def iter_products(self, page_size: int = 10) -> Iterator[Product]:
+        """Iterate over all products, fetching pages on demand
+        
+        Args:
+            page_size: Items per page (default: 10)
+            
+        Returns:
+            Iterator of Product instances
+        """
+        return self._iter_items('/api/products/list', Product.from_dict, page_size)
     
     def get_product(self, product_id: str) -> Product:
         """Get product details by ID
@@ -200,11 +413,18 @@ class BagelPayClient:
         Returns:
             Product details
         """
+        cache_key = ('get_product', product_id)
+        cached: Optional[Product] = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
         data = self._make_request(
             method='GET',
             endpoint=f'/api/products/{product_id}'
         )
-        return Product.from_dict(data)
+        result = Product.from_dict(data)
+        self._cache_set(cache_key, result)
+        return result
     
     def archive_product(self, product_id: str) -> Product:
         """Archive a product
@@ -219,6 +439,7 @@ class BagelPayClient:
             method='POST',
             endpoint=f'/api/products/{product_id}/archive'
         )
+        self.clear_cache()
         return Product.from_dict(data)
     
     def unarchive_product(self, product_id: str) -> Product:
@@ -234,8 +455,23 @@ class BagelPayClient:
             method='POST',
             endpoint=f'/api/products/{product_id}/unarchive'
         )
+        self.clear_cache()
         return Product.from_dict(data)
     
+    def set_product_archived(self, product_id: str, archived: bool) -> Product:
+        """Archive or unarchive a product
+        
+        Args:
+            product_id: Product ID
+            archived: True to archive the product, False to unarchive it
+            
+        Returns:
+            Updated product details
+        """
+        if archived:
+            return self.archive_product(product_id)
+        return self.unarchive_product(product_id)
+    
     def update_product(self, request: UpdateProductRequest) -> Product:
         """Update a product
         
@@ -250,6 +486,7 @@ class BagelPayClient:
             endpoint='/api/products/update',
             data=request.to_dict()
         )
+        self.clear_cache()
         return Product.from_dict(data)
     
     def list_transactions(
@@ -266,6 +503,7 @@ class BagelPayClient:
         Returns:
             Paginated list of transactions
         """
+        _check_pagination(pageNum, pageSize)
         params = {
             'pageNum': pageNum,
             'pageSize': pageSize
@@ -278,6 +516,17 @@ class BagelPayClient:
         )
         return TransactionListResponse.from_dict(data)
     
+    def iter_transactions(self, page_size: int = 10) -> Iterator[Transaction]:
+        """Iterate over all transactions, fetching pages on demand
+        
+        Args:
+            page_size: Items per page (default: 10)
+            
+        Returns:
+            Iterator of Transaction instances
+        """
+        return self._iter_items('/api/transactions/list', Transaction.from_dict, page_size)
+    
     def list_subscriptions(
         self,
         pageNum: int = 1,
@@ -292,6 +541,12 @@ class BagelPayClient:
         Returns:
             Paginated list of subscriptions
         """
+        _check_pagination(pageNum, pageSize)
+        cache_key = ('list_subscriptions', pageNum, pageSize)
+        cached: Optional[SubscriptionListResponse] = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
         params = {
             'pageNum': pageNum,
             'pageSize': pageSize
@@ -302,22 +557,59 @@ class BagelPayClient:
             endpoint='/api/subscriptions/list',
             params=params
         )
-        return SubscriptionListResponse.from_dict(data)
+        result = SubscriptionListResponse.from_dict(data)
+        self._cache_set(cache_key, result)
+        self.prime_subscription_cache(result.items)
+        return result
+    
+    def iter_subscriptions(self, page_size: int = 10) -> Iterator[Subscription]:
+        """Iterate over all subscriptions, fetching pages on demand
+        
+        Args:
+            page_size: Items per page (default: 10)
+            
+        Returns:
+            Iterator of Subscription instances
+        """
+        return self._iter_items('/api/subscriptions/list', Subscription.from_dict, page_size)
+    
+    def prime_subscription_cache(self, subscriptions: Iterable[Subscription]) -> None:
+        """Store already-fetched subscriptions for later get_subscription calls
+        
+        Called by list_subscriptions; can also be given subscriptions listed
+        through another client. Does nothing when caching is disabled.
+        
+        Args:
+            subscriptions: Subscription instances, e.g. items of a listing page
+        """
+        if self.cache_ttl <= 0:
+            return
+        for subscription in subscriptions:
+            if subscription.subscription_id:
+                self._cache_set(('get_subscription', subscription.subscription_id), subscription)
     
-    def get_subscription(self, subscription_id: str) -> Subscription:
+    def get_subscription(self, subscription_id: str, force_refresh: bool = False) -> Subscription:
         """Get subscription details by ID
         
         Args:
             subscription_id: Subscription ID
+            force_refresh: Skip the cache and fetch from the API (default: False)
             
         Returns:
             Subscription details
         """
+        cache_key = ('get_subscription', subscription_id)
+        cached: Optional[Subscription] = None if force_refresh else self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
         data = self._make_request(
             method='GET',
             endpoint=f'/api/subscriptions/{subscription_id}'
         )
-        return Subscription.from_dict(data)
+        result = Subscription.from_dict(data)
+        self._cache_set(cache_key, result)
+        return result
     
     def cancel_subscription(self, subscription_id: str) -> Subscription:
         """Cancel a subscription
@@ -332,6 +624,9 @@ class BagelPayClient:
             method='POST',
             endpoint=f'/api/subscriptions/{subscription_id}/cancel'
         )
+        # Only subscription state changed; cached products stay valid
+        self._cache.pop(('get_subscription', subscription_id), None)
+        self._cache_drop('list_subscriptions', 'list_customers')
         return Subscription.from_dict(data)
     
     def list_customers(
@@ -348,6 +643,12 @@ class BagelPayClient:
         Returns:
             Paginated list of customers
         """
+        _check_pagination(pageNum, pageSize)
+        cache_key = ('list_customers', pageNum, pageSize)
+        cached: Optional[CustomerListResponse] = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
         params = {
             'pageNum': pageNum,
             'pageSize': pageSize
@@ -358,11 +659,26 @@ class BagelPayClient:
             endpoint='/api/customers/list',
             params=params
         )
-        return CustomerListResponse.from_dict(data)
+        result = CustomerListResponse.from_dict(data)
+        self._cache_set(cache_key, result)
+        return result
+    
+    def iter_customers(self, page_size: int = 10) -> Iterator[CustomerData]:
+        """Iterate over all customers, fetching pages on demand
+        
+        Args:
+            page_size: Items per page (default: 10)
+            
+        Returns:
+            Iterator of CustomerData instances
+        """
+        return self._iter_items('/api/customers/list', CustomerData.from_dict, page_size)
     
     def close(self):
         """Close the HTTP session"""
         self.session.close()
+        if self._http2_client is not None:
+            self._http2_client.close()
     
     def __enter__(self):
         """Context manager entry"""
@@ -1,9 +1,21 @@
 """BagelPay API Models"""
 
+import sys
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 from datetime import datetime
 
+from .exceptions import BagelPayValidationError
+
+
+# List-item models are created in bulk when paging through results; on
+# Python 3.10+ they are generated with __slots__ to drop the per-instance
+# __dict__ and speed up attribute access.
+_DATACLASS_KWARGS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Billing types accepted by CreateProductRequest
+_BILLING_TYPES = frozenset({"single_payment", "subscription"})
+
 
 @dataclass
 class Customer:
@@ -95,6 +107,17 @@ class CreateProductRequest:
     recurring_interval: str  
     trial_days: int 
 
+    def __post_init__(self) -> None:
+        """Reject obviously invalid products before any request is sent"""
+        if not self.name:
+            raise BagelPayValidationError("Product name is required")
+        if self.price <= 0:
+            raise BagelPayValidationError(f"Price must be positive, got {self.price}")
+        if not (len(self.currency) == 3 and self.currency.isalpha() and self.currency.isupper()):
+            raise BagelPayValidationError(f"Currency must be a 3-letter ISO code, got {self.currency!r}")
+        if self.billing_type not in _BILLING_TYPES:
+            raise BagelPayValidationError(f"Unsupported billing type: {self.billing_type!r}")
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API requests"""      
         return {
@@ -110,7 +133,7 @@ class CreateProductRequest:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class Product:
     """Product model"""
     name: Optional[str] = None
@@ -208,7 +231,7 @@ class UpdateProductRequest:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class TransactionCustomer:
     """Customer data in transaction"""
     id: Optional[str]
@@ -223,7 +246,7 @@ class TransactionCustomer:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class Transaction:
     """Transaction model"""
     object: Optional[str]
@@ -292,7 +315,7 @@ class TransactionListResponse:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class SubscriptionCustomer:
     """Customer data in subscription"""
     id: Optional[str]
@@ -312,7 +335,7 @@ class SubscriptionCustomer:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class Subscription:
     """Subscription model"""
     status: Optional[str]
@@ -381,7 +404,7 @@ class SubscriptionListResponse:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class CustomerData:
     """Customer data model"""
     id: Optional[int]